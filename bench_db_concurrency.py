@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+
+os.environ.setdefault('TTS_STARTUP', 'lazy')  # the benchmark never speaks
+
+from sqlalchemy import create_engine, event, text
+
+from app import app, apply_sqlite_pragmas
+
+# Benchmark: mixed login/register traffic from several worker processes (like
+# gunicorn -w N) against one copy of petcare.db, default SQLite vs SQLITE_PRAGMAS
+WORKERS = 4
+DURATION = 3.0  # seconds per configuration
+REGISTER_SHARE = 0.2
+SOURCE_DB = os.path.join(app.instance_path, 'petcare.db')
+
+CONFIGS = [
+    ('default (rollback journal, FULL sync)', False, True),
+    ('WAL + pragmas', True, True),
+    ('WAL + pragmas, batched last_login', True, False),
+]
+
+def worker(path, tuned, write_last_login, seed, results):
+    engine = create_engine(f'sqlite:///{path}', pool_size=1)
+    if tuned:
+        event.listen(engine, 'connect', lambda conn, record: apply_sqlite_pragmas(conn, app.config['SQLITE_PRAGMAS']))
+    rng = random.Random(seed)
+    with engine.connect() as conn:
+        emails = [row[0] for row in conn.execute(text("SELECT email FROM users"))]
+    ops, errors, latencies = 0, 0, []
+    deadline = time.perf_counter() + DURATION
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if rng.random() < REGISTER_SHARE:
+                email = f"bench{seed}-{ops}@example.com"
+                with engine.begin() as conn:
+                    conn.execute(text("INSERT INTO users (username, password, email, full_name) "
+                                      "VALUES (:u, 'x', :e, 'Bench') ON CONFLICT (email) DO NOTHING"),
+                                 {'u': email.split('@')[0], 'e': email})
+            else:
+                with engine.begin() as conn:
+                    user = conn.execute(text("SELECT id, password FROM users WHERE email = :e"),
+                                        {'e': rng.choice(emails)}).first()
+                    if write_last_login:
+                        conn.execute(text("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = :id"),
+                                     {'id': user.id})
+            ops += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+        except Exception:
+            errors += 1
+    results.put((ops, errors, latencies))
+
+def run(tuned, write_last_login):
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'petcare.db')
+    shutil.copy(SOURCE_DB, path)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = DELETE")  # start every run from a plain rollback-journal file
+    conn.close()
+    ctx = multiprocessing.get_context('fork')
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker, args=(path, tuned, write_last_login, i, results)) for i in range(WORKERS)]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    shutil.rmtree(workdir)
+    ops = sum(c[0] for c in collected)
+    errors = sum(c[1] for c in collected)
+    latencies = sorted(l for c in collected for l in c[2])
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0
+    return ops / DURATION, p95, errors
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print(f"📊 PETCARE.DB UNDER {WORKERS} WORKER PROCESSES ({DURATION:.0f}s each, "
+          f"{REGISTER_SHARE:.0%} registrations / {1 - REGISTER_SHARE:.0%} logins)")
+    print("=" * 60)
+    baseline = None
+    for label, tuned, write_last_login in CONFIGS:
+        throughput, p95, errors = run(tuned, write_last_login)
+        baseline = baseline or throughput
+        print(f"   • {label:36} {throughput:8.0f} ops/s ({throughput / baseline:4.1f}x) "
+              f"| p95 {p95:7.2f} ms | {errors} locked/failed")
+    print("=" * 60)
@@ -0,0 +1,105 @@
+import os
+import random
+import tempfile
+import time
+
+# A throwaway database (the catalogue is seeded into it) and no TTS workers
+WORKDIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORKDIR, 'petcare.db')}"
+os.environ.setdefault('TTS_STARTUP', 'lazy')
+
+from app import app, fold_text, get_catalogue, get_intent_matcher, CHAT_INTENTS, IntentMatcher, migrate
+
+# Microbenchmark: per-message intent classification for /api/ollama/chat
+MESSAGES = [
+    "find vets near me", "clinics in manila", "emergency vet please", "where can i buy dog food",
+    "how many clinics do you have", "can you speak", "hello there", "kamusta",
+    "is there a veterinarian in quezon city", "my dog is sick what should i do",
+    "pet shop in cebu", "any 24/7 hospital around davao", "good morning", "total stores",
+    "vet in parañaque", "clinics in las pinas",
+]
+
+def legacy_classify(message):
+    """The old if/elif chain, city lists rebuilt on every call"""
+    if any(word in message for word in ['clinic', 'vet', 'veterinarian', 'hospital', 'doctor']):
+        cities = ['manila', 'makati', 'quezon', 'pasig', 'cebu', 'davao', 'cdo', 'baguio', 'laguna', 'cavite']
+        return 'clinic', next((city for city in cities if city in message), None)
+    elif any(word in message for word in ['store', 'shop', 'pet store', 'buy', 'pet shop']):
+        return 'store', None
+    elif 'emergency' in message or 'urgent' in message or '24/7' in message:
+        return 'emergency', None
+    elif any(word in message for word in ['manila', 'makati', 'quezon', 'pasig', 'cebu', 'davao', 'cdo', 'baguio']):
+        cities_found = []
+        for city in ['manila', 'makati', 'quezon', 'pasig', 'cebu', 'davao', 'cdo', 'baguio']:
+            if city in message:
+                cities_found.append(city)
+        return 'city', cities_found[0]
+    elif 'how many' in message or 'statistics' in message or 'total' in message:
+        return 'statistics', None
+    elif 'voice' in message or 'speak' in message or 'talk' in message:
+        return 'voice', None
+    elif any(word in message for word in ['hello', 'hi', 'hey', 'kamusta', 'good morning', 'good afternoon']):
+        return 'greeting', None
+    return None, None
+
+def naive_classifier(intents, catalogue_cities):
+    """Same vocabulary as IntentMatcher, checked with one `in` per word"""
+    plan = []
+    for intent in intents:
+        cities = [fold_text(c) for c in intent['cities']]
+        if intent['catalogue_cities']:
+            cities += [fold_text(c) for c in catalogue_cities if fold_text(c) not in cities]
+        plan.append((intent['name'], [fold_text(w) for w in intent['keywords']], cities, intent['match_cities']))
+
+    def classify(message):
+        message = fold_text(message)
+        for name, keywords, cities, match_cities in plan:
+            city = next((c for c in cities if c in message), None)
+            if any(word in message for word in keywords) or (match_cities and city):
+                return name, city
+        return None, None
+    return classify
+
+def per_message_us(fn, messages, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            fn(message)
+        best = min(best, (time.perf_counter() - start) / len(messages))
+    return best * 1_000_000
+
+if __name__ == '__main__':
+    with app.app_context():
+        migrate()
+        snapshot = get_catalogue()
+        start = time.perf_counter()
+        matcher = get_intent_matcher(snapshot)
+        build_ms = (time.perf_counter() - start) * 1000
+
+    def compiled_classify(message):
+        intent, city = matcher.classify(message)
+        return (intent['name'] if intent else None), city
+
+    rng = random.Random(7)
+    messages = [rng.choice(MESSAGES) for _ in range(20_000)]
+
+    # A nationwide catalogue: the rule engine's vocabulary grows with it
+    big_cities = [f"{rng.choice(['san', 'santa', 'new', 'port'])} {i}ville" for i in range(2000)]
+    big_matcher = IntentMatcher(CHAT_INTENTS, big_cities)
+    big_compiled = lambda message: big_matcher.classify(message)
+
+    print("=" * 60)
+    print("📊 CHAT INTENT CLASSIFICATION (µs per message, best of 5)")
+    print("=" * 60)
+    print(f"\n📍 Real catalogue ({len(snapshot.lookup.city_names)} cities, matcher compiled in {build_ms:.2f} ms)")
+    print(f"   • legacy if/elif chain (10 fixed cities): {per_message_us(legacy_classify, messages):7.2f} µs")
+    print(f"   • naive `in` checks, same vocabulary:     {per_message_us(naive_classifier(CHAT_INTENTS, snapshot.lookup.city_names), messages):7.2f} µs")
+    print(f"   • compiled matcher:                       {per_message_us(compiled_classify, messages):7.2f} µs")
+    print(f"\n📍 Synthetic catalogue ({len(big_cities):,} cities)")
+    print(f"   • naive `in` checks, same vocabulary:     {per_message_us(naive_classifier(CHAT_INTENTS, big_cities), messages, 1):7.2f} µs")
+    print(f"   • compiled matcher:                       {per_message_us(big_compiled, messages):7.2f} µs")
+    print("\n🔍 Sample classifications (legacy -> compiled):")
+    for message in MESSAGES:
+        print(f"   • {message!r}: {legacy_classify(message)} -> {compiled_classify(message)}")
+    print("=" * 60)
@@ -0,0 +1,73 @@
+import random
+import time
+
+from app import calculate_distance, clinic_location, store_location, LocationColumns, np
+
+# Benchmark /api/locations: the old per-row loop vs the vectorized engine
+SIZES = [100, 10_000, 1_000_000]
+QUERIES = [(14.5995, 120.9842), (10.3157, 123.9054), (7.0645, 125.6078), (16.4123, 120.5934)]
+
+def make_catalogue(n, seed=42):
+    """Synthetic clinics + stores scattered over the Philippines (80/20 split)"""
+    rng = random.Random(seed)
+    clinics, stores = [], []
+    for i in range(n):
+        lat, lng = rng.uniform(5.5, 18.5), rng.uniform(117.0, 126.5)
+        if i % 5:
+            clinics.append({"name": f"Clinic {i}", "address": "Somewhere", "lat": lat, "lng": lng,
+                            "contact": "", "services": "", "hours": "", "emergency": False,
+                            "city": "City", "region": "Region"})
+        else:
+            stores.append({"name": f"Store {i}", "address": "Somewhere", "lat": lat, "lng": lng,
+                           "contact": "", "type": "Pet Store"})
+    return clinics, stores
+
+def loop_locations(clinics, stores, lat, lng):
+    """What get_locations did before: one scalar distance and one dict per row"""
+    locations = []
+    for i, clinic in enumerate(clinics):
+        locations.append(clinic_location(i, clinic, calculate_distance(lat, lng, clinic["lat"], clinic["lng"])))
+    for i, store in enumerate(stores):
+        locations.append(store_location(i, store, calculate_distance(lat, lng, store["lat"], store["lng"])))
+    locations.sort(key=lambda x: x['distance'])
+    return [loc for loc in locations if loc['distance'] <= 50][:30]
+
+def vectorized_locations(columns, lat, lng):
+    return [
+        clinic_location(i, columns.clinics[i], d) if kind == 0 else store_location(i, columns.stores[i], d)
+        for d, kind, i in columns.nearest(lat, lng, 50, 30)
+    ]
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for lat, lng in QUERIES:
+            fn(lat, lng)
+        best = min(best, (time.perf_counter() - start) / len(QUERIES))
+    return best * 1000
+
+if __name__ == '__main__':
+    if np is None:
+        print("❌ NumPy is not installed - the vectorized engine is disabled")
+        raise SystemExit(1)
+
+    print("=" * 60)
+    print("📊 /api/locations BENCHMARK (ms per query, best of runs)")
+    print("=" * 60)
+    for n in SIZES:
+        clinics, stores = make_catalogue(n)
+        start = time.perf_counter()
+        columns = LocationColumns(clinics, stores)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for lat, lng in QUERIES:
+            assert loop_locations(clinics, stores, lat, lng) == vectorized_locations(columns, lat, lng)
+
+        repeat = 1 if n >= 1_000_000 else 5
+        loop_ms = best_of(lambda lat, lng: loop_locations(clinics, stores, lat, lng), repeat)
+        vec_ms = best_of(lambda lat, lng: vectorized_locations(columns, lat, lng), repeat)
+        print(f"\n📍 {n:,} points (columns built in {build_ms:.1f} ms)")
+        print(f"   • loop:       {loop_ms:10.3f} ms")
+        print(f"   • vectorized: {vec_ms:10.3f} ms  ({loop_ms / vec_ms:.1f}x)")
+    print("=" * 60)
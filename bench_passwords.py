@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+# A throwaway database (the side-route check seeds it) and no TTS workers
+WORKDIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORKDIR, 'petcare.db')}"
+os.environ.setdefault('TTS_STARTUP', 'lazy')
+
+from app import app, derive_key, get_password_hasher, kdf_params, migrate, PasswordBusy
+
+# Benchmark: password hashing cost per login, and how many logins a core can
+# verify at the PASSWORD_* settings in app.py
+PASSWORD = 'correct horse battery staple'
+
+def per_hash_ms(params, repeat=5):
+    salt = os.urandom(16)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if params[0] == 'sha256':
+            hashlib.sha256(PASSWORD.encode()).digest()
+        else:
+            derive_key(PASSWORD, salt, params)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def burst(workers, logins):
+    """Verify `logins` passwords from as many threads at once through the hasher pool"""
+    app.config['PASSWORD_WORKERS'] = workers
+    app.config['PASSWORD_QUEUE_SIZE'] = logins
+    hasher = get_password_hasher()
+    stored = hasher.hash(PASSWORD)
+    threads = [threading.Thread(target=hasher.verify, args=(PASSWORD, stored)) for _ in range(logins)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return logins / (time.perf_counter() - start)
+
+def side_route_ms(workers, logins):
+    """Latency of a cheap route while a login burst is being hashed"""
+    app.config['PASSWORD_WORKERS'] = workers
+    app.config['PASSWORD_QUEUE_SIZE'] = logins
+    hasher = get_password_hasher()
+    stored = hasher.hash(PASSWORD)
+    client = app.test_client()
+    client.get('/api/clinics/emergency')
+    threads = [threading.Thread(target=hasher.verify, args=(PASSWORD, stored)) for _ in range(logins)]
+    for thread in threads:
+        thread.start()
+    samples = []
+    while any(thread.is_alive() for thread in threads):
+        start = time.perf_counter()
+        client.get('/api/clinics/emergency')
+        samples.append((time.perf_counter() - start) * 1000)
+    for thread in threads:
+        thread.join()
+    samples.sort()
+    return samples[len(samples) // 2], samples[-1]
+
+if __name__ == '__main__':
+    cores = os.cpu_count() or 1
+    configured = kdf_params()
+    with app.app_context():
+        migrate()
+
+    print("=" * 60)
+    print(f"📊 PASSWORD HASHING ({cores} CPU core(s), configured: {'$'.join(map(str, configured))})")
+    print("=" * 60)
+    print("\n🔐 Cost of one hash (best of 5), and logins one core can verify")
+    schemes = [
+        ('sha256', ),
+        ('pbkdf2_sha256', 100000),
+        ('pbkdf2_sha256', app.config['PASSWORD_PBKDF2_ITERATIONS']),
+        ('scrypt', 2 ** 14, 8, 1),
+        ('scrypt', 2 ** 15, 8, 1),
+        ('scrypt', 2 ** 16, 8, 1),
+    ]
+    for params in schemes:
+        ms = per_hash_ms(params)
+        marker = ' ← configured' if params == configured else ''
+        label = '$'.join(map(str, params)) if params[0] != 'sha256' else 'sha256 (legacy, unsalted)'
+        print(f"   • {label:28} {ms:8.2f} ms  {1000 / ms:10.0f} logins/s/core{marker}")
+
+    logins = 8 * cores
+    print(f"\n🚦 Burst of {logins} logins through the hasher pool")
+    for workers in sorted({1, max(1, cores // 2), cores}):
+        print(f"   • {workers} worker(s): {burst(workers, logins):6.1f} logins/s")
+
+    print(f"\n⏱️  /api/clinics/emergency during a burst of {logins} logins (p50 / max)")
+    for workers in sorted({1, cores}):
+        p50, worst = side_route_ms(workers, logins)
+        print(f"   • {workers} worker(s): {p50:6.2f} ms / {worst:6.2f} ms")
+
+    app.config['PASSWORD_WORKERS'], app.config['PASSWORD_QUEUE_SIZE'] = 1, 0
+    hasher = get_password_hasher()
+    stored = hasher.hash(PASSWORD)
+    results = []
+    def attempt():
+        try:
+            results.append(hasher.verify(PASSWORD, stored)[0])
+        except PasswordBusy:
+            results.append('busy')
+    threads = [threading.Thread(target=attempt) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"\n🛑 1 worker, no queue: {results.count(True)} of 10 simultaneous logins hashed, "
+          f"{results.count('busy')} turned away with 503")
+    print("=" * 60)
@@ -0,0 +1,84 @@
+import heapq
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from app import bounding_box, calculate_distance, RTREE_CANDIDATES_SQL
+from init_db import create_catalogue_triggers
+
+# Benchmark radius searches on vet_clinics: R*Tree prefilter vs full table scan
+ROWS = 100_000
+QUERIES = [(14.5995, 120.9842, 15), (10.3157, 123.9054, 20), (7.0645, 125.6078, 50), (16.4123, 120.5934, 50)]
+
+def build_db(path, rows):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE vet_clinics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        clinic_name TEXT NOT NULL,
+        address TEXT NOT NULL,
+        latitude REAL NOT NULL,
+        longitude REAL NOT NULL,
+        verified BOOLEAN DEFAULT 1
+    )
+    ''')
+    cursor.execute("CREATE TABLE pet_stores (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL)")
+    create_catalogue_triggers(cursor)
+    rng = random.Random(42)
+    cursor.executemany(
+        "INSERT INTO vet_clinics (clinic_name, address, latitude, longitude) VALUES (?, ?, ?, ?)",
+        [(f"Clinic {i}", "Somewhere", rng.uniform(5.5, 18.5), rng.uniform(117.0, 126.5)) for i in range(rows)]
+    )
+    conn.commit()
+    return conn
+
+def nearest(rows, lat, lng, radius_km, limit=10):
+    hits = []
+    for row_id, row_lat, row_lng in rows:
+        distance = calculate_distance(lat, lng, row_lat, row_lng)
+        if distance <= radius_km:
+            hits.append((distance, row_id))
+    return heapq.nsmallest(limit, hits)
+
+def full_scan(conn, lat, lng, radius_km):
+    rows = conn.execute("SELECT id, latitude, longitude FROM vet_clinics WHERE verified = 1")
+    return nearest(rows, lat, lng, radius_km)
+
+def rtree_query(conn, lat, lng, radius_km):
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    rows = conn.execute(
+        "SELECT id, latitude, longitude FROM vet_clinics WHERE verified = 1 AND "
+        + RTREE_CANDIDATES_SQL.format(table='vet_clinics'),
+        {'min_lat': min_lat, 'max_lat': max_lat, 'min_lng': min_lng, 'max_lng': max_lng}
+    )
+    return nearest(rows, lat, lng, radius_km)
+
+def best_of(fn, conn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for lat, lng, radius_km in QUERIES:
+            fn(conn, lat, lng, radius_km)
+        best = min(best, (time.perf_counter() - start) / len(QUERIES))
+    return best * 1000
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        conn = build_db(os.path.join(tmp, 'bench.db'), ROWS)
+        print("=" * 60)
+        print(f"📊 RADIUS SEARCH OVER {ROWS:,} CLINICS (built in {time.perf_counter() - start:.1f}s)")
+        print("=" * 60)
+
+        for lat, lng, radius_km in QUERIES:
+            assert full_scan(conn, lat, lng, radius_km) == rtree_query(conn, lat, lng, radius_km)
+
+        scan_ms = best_of(full_scan, conn)
+        rtree_ms = best_of(rtree_query, conn)
+        print(f"   • full table scan: {scan_ms:9.3f} ms per query")
+        print(f"   • R*Tree prefilter: {rtree_ms:8.3f} ms per query  ({scan_ms / rtree_ms:.1f}x)")
+        print("=" * 60)
+        conn.close()
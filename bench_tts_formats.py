@@ -0,0 +1,64 @@
+import base64
+import io
+import math
+import os
+import struct
+import time
+import wave
+
+from app import audio_encoder, encode_audio, AUDIO_FORMATS
+
+# Benchmark /api/tts output formats: bytes on the wire and encode cost per reply
+SAMPLE = 'temp_speech.wav'  # a pyttsx3 reply (22 kHz mono) left over from the old TTS path
+
+def sample_wav():
+    """The checked-in pyttsx3 reply, or 12s of synthetic voice-band audio without it"""
+    if os.path.exists(SAMPLE):
+        with open(SAMPLE, 'rb') as f:
+            return f.read()
+    rate = 22050
+    frames = b''.join(
+        struct.pack('<h', int(8000 * math.sin(2 * math.pi * (180 + 60 * math.sin(i / 4000)) * i / rate)
+                               * (0.5 + 0.5 * math.sin(i / 1500))))
+        for i in range(rate * 12)
+    )
+    path = 'bench_sample.wav'
+    with wave.open(path, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+    with open(path, 'rb') as f:
+        data = f.read()
+    os.remove(path)
+    return data
+
+def best_of(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+if __name__ == '__main__':
+    wav = sample_wav()
+    with wave.open(io.BytesIO(wav)) as w:
+        seconds = w.getnframes() / w.getframerate()
+
+    print("=" * 60)
+    print(f"📊 /api/tts FORMATS ({seconds:.1f}s of speech, {len(wav) / 1024:.0f} KB WAV)")
+    print("=" * 60)
+    for fmt, spec in AUDIO_FORMATS.items():
+        if fmt == 'wav':
+            data, encode_ms = wav, 0.0
+        elif audio_encoder(fmt) is None:
+            print(f"   • {fmt:5} ❌ no encoder (install ffmpeg, or set TTS_FFMPEG)")
+            continue
+        else:
+            data, encode_ms = best_of(lambda: encode_audio(wav, fmt))
+        streamed = len(base64.b64encode(data))
+        print(f"   • {fmt:5} {spec['mimetype']:11} {len(data) / 1024:7.1f} KB "
+              f"({len(wav) / len(data):5.1f}x smaller, {len(data) * 8 / seconds / 1000:6.1f} kbit/s) "
+              f"| as base64 {streamed / 1024:7.1f} KB | encode {encode_ms:6.1f} ms")
+    print("=" * 60)
@@ -0,0 +1,238 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+
+os.environ.setdefault('TTS_STARTUP', 'lazy')  # an import never speaks
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import app, db, hold_catalogue_version, migrate, PetStore, release_catalogue_version, VetClinic
+
+# Streams clinic/store files into vet_clinics / pet_stores (DATABASE_URL, or instance/petcare.db):
+#   python import_catalogue.py clinics clinics.csv more_clinics.geojson
+#   python import_catalogue.py stores stores.jsonl --batch-size 20000
+# CSV, JSON (an array), JSON Lines and GeoJSON FeatureCollections are read
+# incrementally. Rows are upserted by natural key (name + address), so
+# re-running a file updates rows in place; users and sessions are untouched.
+# The version triggers and spatial index stay live throughout, so the app can
+# keep writing to the catalogue while a file loads and a killed import leaves
+# nothing to repair: every committed batch is already indexed. Each batch
+# renews a hold on catalogue_version, and the import bumps it once at the end,
+# so the app rebuilds its snapshot once per import rather than once per batch
+# (a killed import's hold lapses after CATALOGUE_HOLD_SECONDS).
+
+# column -> names accepted in the source, the first being the column itself;
+# the others are the keys the app's own clinic/store dicts use
+KINDS = {
+    'clinics': {
+        'model': VetClinic,
+        'key': ('clinic_name', 'address'),
+        'fields': {
+            'clinic_name': ('clinic_name', 'name'),
+            'address': ('address',),
+            'latitude': ('latitude', 'lat'),
+            'longitude': ('longitude', 'lng', 'lon'),
+            'contact': ('contact', 'phone'),
+            'email': ('email',),
+            'services': ('services',),
+            'operating_hours': ('operating_hours', 'hours'),
+            'region': ('region',),
+            'city': ('city',),
+            'is_emergency': ('is_emergency', 'emergency'),
+            'is_24hours': ('is_24hours', '24hours'),
+            'verified': ('verified',),
+        },
+    },
+    'stores': {
+        'model': PetStore,
+        'key': ('store_name', 'address'),
+        'fields': {
+            'store_name': ('store_name', 'name'),
+            'address': ('address',),
+            'latitude': ('latitude', 'lat'),
+            'longitude': ('longitude', 'lng', 'lon'),
+            'contact': ('contact', 'phone'),
+            'store_type': ('store_type', 'type'),
+            'verified': ('verified',),
+        },
+    },
+}
+# verified is None when the source leaves it out: new rows are verified, but an
+# existing row keeps whatever an admin set
+BOOLEAN_DEFAULTS = {'is_emergency': False, 'is_24hours': False, 'verified': None}
+
+# ========== READERS ==========
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.DictReader(f)
+
+def read_json_lines(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def read_json(path, chunk_size=1 << 16):
+    """Objects of a JSON array, or of a GeoJSON FeatureCollection's "features",
+    decoded one at a time so the file never has to fit in memory"""
+    decoder = json.JSONDecoder()
+    start = re.compile(r'\s*\[|.*?"features"\s*:\s*\[', re.S)
+    with open(path, encoding='utf-8') as f:
+        buffer, eof = '', False
+        while True:
+            match = start.match(buffer)
+            if match or eof:
+                break
+            chunk = f.read(chunk_size)
+            buffer, eof = buffer + chunk, not chunk
+        if not match:
+            raise ValueError(f"{path}: expected a JSON array or a GeoJSON FeatureCollection")
+        pos = match.end()
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+            yield item
+            pos = end
+
+def read_records(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return read_csv(path)
+    if extension in ('.jsonl', '.ndjson'):
+        return read_json_lines(path)
+    if extension in ('.json', '.geojson'):
+        return read_json(path)
+    raise ValueError(f"{path}: unsupported file type (use .csv, .json, .jsonl or .geojson)")
+
+# ========== ROWS ==========
+def parse_bool(value, default):
+    if value is None or value == '':
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'y', 't')
+    return bool(value)
+
+def to_row(spec, record):
+    """A column dict for one source record, or None if it cannot be placed on the map"""
+    if record.get('type') == 'Feature':
+        properties = dict(record.get('properties') or {})
+        coordinates = (record.get('geometry') or {}).get('coordinates') or [None, None]
+        properties.setdefault('longitude', coordinates[0])
+        properties.setdefault('latitude', coordinates[1])
+        record = properties
+    row = {}
+    table = spec['model'].__table__
+    for column, names in spec['fields'].items():
+        value = next((record[name] for name in names if record.get(name) not in (None, '')), None)
+        if column in BOOLEAN_DEFAULTS:
+            row[column] = parse_bool(value, BOOLEAN_DEFAULTS[column])
+        elif column in ('latitude', 'longitude'):
+            try:
+                row[column] = float(value)
+            except (TypeError, ValueError):
+                return None
+        elif column == 'email':
+            row[column] = None if value is None else str(value).strip()  # UNIQUE in older petcare.db files, so no ''
+        else:
+            # Text columns are never NULL: the catalogue snapshot indexes them as strings
+            value = '' if value is None else str(value).strip()
+            length = table.columns[column].type.length
+            row[column] = value[:length] if length else value
+    if not all(row[column] for column in spec['key']):
+        return None
+    if not (-90 <= row['latitude'] <= 90 and -180 <= row['longitude'] <= 180):
+        return None
+    return row
+
+def batches(spec, paths, batch_size, counts):
+    """Lists of at most batch_size rows, one row per natural key (the last one wins)"""
+    batch = {}
+    for path in paths:
+        for record in read_records(path):
+            counts['read'] += 1
+            row = to_row(spec, record)
+            if row is None:
+                counts['skipped'] += 1
+                continue
+            batch[tuple(row[column] for column in spec['key'])] = row
+            if len(batch) >= batch_size:
+                yield list(batch.values())
+                batch = {}
+    if batch:
+        yield list(batch.values())
+
+# ========== IMPORT ==========
+def import_files(kind, paths, batch_size=10000, quiet=False):
+    """Upsert every row of paths into the kind's table; returns the counts"""
+    spec = KINDS[kind]
+    table = spec['model'].__table__
+    counts = dict.fromkeys(('read', 'skipped', 'upserted', 'inserted', 'updated'), 0)
+    with app.app_context():
+        migrate()  # tables, triggers and the natural-key index the upsert needs
+        dialect = db.engine.dialect.name
+
+        insert = (postgresql if dialect == 'postgresql' else sqlite).insert(table)
+        updated = [column for column in spec['fields'] if column not in spec['key']]
+        upsert = insert.on_conflict_do_update(
+            index_elements=list(spec['key']),
+            set_={column: insert.excluded[column] for column in updated}
+        )
+        upsert_keep_verified = insert.on_conflict_do_update(
+            index_elements=list(spec['key']),
+            set_={column: insert.excluded[column] for column in updated if column != 'verified'}
+        )
+        with db.engine.connect() as conn:
+            before = conn.execute(db.text(f"SELECT COUNT(*) FROM {table.name}")).scalar()
+
+        start = time.perf_counter()
+        try:
+            for batch in batches(spec, paths, batch_size, counts):
+                given = [row for row in batch if row['verified'] is not None]
+                missing = [dict(row, verified=True) for row in batch if row['verified'] is None]
+                with db.engine.begin() as conn:
+                    hold_catalogue_version(conn)
+                    if given:
+                        conn.execute(upsert, given)
+                    if missing:
+                        conn.execute(upsert_keep_verified, missing)
+                counts['upserted'] += len(batch)
+                if not quiet:
+                    elapsed = time.perf_counter() - start
+                    print(f"   • {counts['upserted']:,} rows ({counts['upserted'] / elapsed:,.0f} rows/s)", flush=True)
+        finally:
+            if counts['upserted']:
+                with db.engine.begin() as conn:
+                    release_catalogue_version(conn)
+        counts['total_seconds'] = time.perf_counter() - start
+        with db.engine.connect() as conn:
+            after = conn.execute(db.text(f"SELECT COUNT(*) FROM {table.name}")).scalar()
+    counts['inserted'] = after - before
+    counts['updated'] = counts['upserted'] - counts['inserted']
+    return counts
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Upsert clinic/store files into the catalogue')
+    parser.add_argument('kind', choices=sorted(KINDS))
+    parser.add_argument('files', nargs='+', help='.csv, .json, .jsonl/.ndjson or .geojson')
+    parser.add_argument('--batch-size', type=int, default=10000, help='rows per transaction')
+    args = parser.parse_args()
+
+    print(f"📥 Importing {args.kind} into {app.config['SQLALCHEMY_DATABASE_URI']}...")
+    counts = import_files(args.kind, args.files, args.batch_size)
+    rate = counts['upserted'] / counts['total_seconds'] if counts['total_seconds'] else 0
+    print(f"✅ {counts['upserted']:,} rows in {counts['total_seconds']:.1f}s ({rate:,.0f} rows/s)")
+    print(f"   • {counts['inserted']:,} new, {counts['updated']:,} updated, {counts['skipped']:,} skipped "
+          f"(no name/address/coordinates) of {counts['read']:,} read")
@@ -1,249 +1,1038 @@
-import sqlite3
-import hashlib
+import sys
 
-def hash_password(password):
-    return hashlib.sha256(password.encode()).hexdigest()
+# ========== COMPREHENSIVE PHILIPPINE CLINICS DATABASE ==========
+# Seed data for vet_clinics; the app serves whatever is in the table
+PH_VET_CLINICS = [
+    # ===== METRO MANILA =====
+    # Makati
+    {"name": "Makati Dog And Cat Hospital", 
+     "address": "5426 Gen. Luna corner Algier St. Poblacion, Makati City", 
+     "lat": 14.5585, "lng": 121.0268, 
+     "contact": "02-8812-3456", "email": "makatidogcat@gmail.com",
+     "services": "Surgery, Vaccination, Dental, Laboratory, X-Ray",
+     "hours": "Mon-Sat 8am-8pm, Sun 9am-5pm",
+     "region": "Metro Manila", "city": "Makati",
+     "emergency": True, "24hours": False},
+    
+    {"name": "Animal House Veterinary Clinic - Makati", 
+     "address": "22 Jupiter St. Bel-Air, Makati City", 
+     "lat": 14.5678, "lng": 121.0345, 
+     "contact": "02-8813-4567", "email": "animalhouse.makati@gmail.com",
+     "services": "General Checkup, Vaccination, Grooming",
+     "hours": "Mon-Fri 9am-7pm, Sat 9am-5pm",
+     "region": "Metro Manila", "city": "Makati",
+     "emergency": False, "24hours": False},
+    
+    {"name": "The Premier Veterinary Clinic", 
+     "address": "Unit B 105 Reposo St., Bel-Air, Makati City", 
+     "lat": 14.5654, "lng": 121.0321, 
+     "contact": "02-8824-5678", "email": "premiervet@gmail.com",
+     "services": "Surgery, Dental, Laboratory, Pharmacy",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Metro Manila", "city": "Makati",
+     "emergency": False, "24hours": False},
+    
+    # Quezon City
+    {"name": "Animal House Veterinary Clinic - Aurora", 
+     "address": "737 Aurora Boulevard, Quezon City", 
+     "lat": 14.6219, "lng": 121.0230, 
+     "contact": "02-8721-2345", "email": "animalhouse.qc@gmail.com",
+     "services": "General Checkup, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-8pm, Sun 9am-5pm",
+     "region": "Metro Manila", "city": "Quezon City",
+     "emergency": True, "24hours": False},
+    
+    {"name": "Vets In Practice Animal Hospital", 
+     "address": "Blue Ridge, 220 C5 Katipunan Ave, Project 4, Quezon City", 
+     "lat": 14.6312, "lng": 121.0721, 
+     "contact": "02-8923-4567", "email": "vetsinpractice@gmail.com",
+     "services": "Emergency, Surgery, ICU, Laboratory, Pharmacy",
+     "hours": "24/7 Emergency, Mon-Sat 8am-8pm Regular",
+     "region": "Metro Manila", "city": "Quezon City",
+     "emergency": True, "24hours": True},
+    
+    {"name": "Congressional Animal Clinic", 
+     "address": "28 Congressional Ave, Project 8, Bago Bantay, Quezon City", 
+     "lat": 14.6589, "lng": 121.0267, 
+     "contact": "02-8934-5678", "email": "congressionalanimal@gmail.com",
+     "services": "Vaccination, Checkup, Minor Surgery",
+     "hours": "Mon-Fri 9am-7pm, Sat 9am-5pm",
+     "region": "Metro Manila", "city": "Quezon City",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Quezon City Veterinary Hospital", 
+     "address": "112 Banawe Street, Quezon City", 
+     "lat": 14.6234, "lng": 121.0056, 
+     "contact": "02-8745-6789", "email": "qcvethospital@gmail.com",
+     "services": "Surgery, Dental, Laboratory, Pharmacy",
+     "hours": "Mon-Sat 8am-8pm",
+     "region": "Metro Manila", "city": "Quezon City",
+     "emergency": True, "24hours": False},
+    
+    # Manila
+    {"name": "Manila Vet Center", 
+     "address": "123 Taft Avenue, Ermita, Manila", 
+     "lat": 14.5789, "lng": 120.9845, 
+     "contact": "02-8523-4567", "email": "manilavetcenter@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Metro Manila", "city": "Manila",
+     "emergency": False, "24hours": False},
+    
+    {"name": "University of the Philippines Veterinary Hospital", 
+     "address": "UP Diliman, Quezon City", 
+     "lat": 14.6567, "lng": 121.0689, 
+     "contact": "02-8981-2345", "email": "upvet@gmail.com",
+     "services": "Full Service, Specialist Referrals, Teaching Hospital",
+     "hours": "Mon-Fri 8am-5pm",
+     "region": "Metro Manila", "city": "Quezon City",
+     "emergency": False, "24hours": False},
+    
+    # Pasig
+    {"name": "Animal Shelter Veterinary Clinic", 
+     "address": "1376 Mercedes Ave, Pasig City", 
+     "lat": 14.5867, "lng": 121.0876, 
+     "contact": "02-8945-6789", "email": "animalshelter.pasig@gmail.com",
+     "services": "General Medicine, Surgery, Vaccination",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Metro Manila", "city": "Pasig",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Ortigas Pet Care Center", 
+     "address": "Unit 101 Ortigas Ave, Pasig City", 
+     "lat": 14.5923, "lng": 121.0567, 
+     "contact": "02-8632-1098", "email": "ortigaspetcare@gmail.com",
+     "services": "Checkup, Vaccination, Grooming",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Metro Manila", "city": "Pasig",
+     "emergency": False, "24hours": False},
+    
+    # San Juan
+    {"name": "The Pet Project Veterinary Clinic & Surgery", 
+     "address": "16 Regidor St. Brgy. Tibagan, San Juan City", 
+     "lat": 14.6023, "lng": 121.0321, 
+     "contact": "02-8956-7890", "email": "thepetproject@gmail.com",
+     "services": "Surgery, Dental, Vaccination, Laboratory",
+     "hours": "Mon-Sat 9am-8pm, Sun 10am-5pm",
+     "region": "Metro Manila", "city": "San Juan",
+     "emergency": True, "24hours": False},
+    
+    # Parañaque
+    {"name": "Peralta Veterinary Center", 
+     "address": "Better Living Subd, Unit 1 JEL Plaza, Dona Soledad Ave Ext, Parañaque", 
+     "lat": 14.4821, "lng": 121.0156, 
+     "contact": "02-8967-8901", "email": "peraltavet@gmail.com",
+     "services": "Checkup, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Metro Manila", "city": "Parañaque",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Carlos Veterinary Clinic", 
+     "address": "Dr. A. Santos Avenue, Parañaque City", 
+     "lat": 14.4875, "lng": 121.0123, 
+     "contact": "02-8824-5678", "email": "carlosvet@gmail.com",
+     "services": "Vaccination, Checkup, Grooming, Pharmacy",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Metro Manila", "city": "Parañaque",
+     "emergency": False, "24hours": False},
+    
+    # Las Piñas
+    {"name": "Las Piñas Veterinary Clinic", 
+     "address": "178 Alabang-Zapote Road, Las Piñas City", 
+     "lat": 14.4567, "lng": 120.9987, 
+     "contact": "02-8876-5432", "email": "laspinasvet@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Metro Manila", "city": "Las Piñas",
+     "emergency": False, "24hours": False},
+    
+    # Mandaluyong
+    {"name": "Mandaluyong Animal Hospital", 
+     "address": "123 Boni Avenue, Mandaluyong City", 
+     "lat": 14.5789, "lng": 121.0345, 
+     "contact": "02-8532-1098", "email": "mandaluyonganimal@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Metro Manila", "city": "Mandaluyong",
+     "emergency": False, "24hours": False},
+    
+    # Marikina
+    {"name": "Marikina Veterinary Clinic", 
+     "address": "45 J.P. Rizal St., Marikina City", 
+     "lat": 14.6345, "lng": 121.0987, 
+     "contact": "02-8943-2109", "email": "marikinavet@gmail.com",
+     "services": "Checkup, Vaccination, Grooming",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Metro Manila", "city": "Marikina",
+     "emergency": False, "24hours": False},
+    
+    # Muntinlupa
+    {"name": "Muntinlupa Veterinary Center", 
+     "address": "78 National Road, Muntinlupa City", 
+     "lat": 14.4234, "lng": 121.0456, 
+     "contact": "02-8876-1234", "email": "muntinlupavet@gmail.com",
+     "services": "General Practice, Vaccination",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Metro Manila", "city": "Muntinlupa",
+     "emergency": False, "24hours": False},
+    
+    # Taguig
+    {"name": "BGC Animal Clinic", 
+     "address": "Bonifacio Global City, Taguig", 
+     "lat": 14.5567, "lng": 121.0456, 
+     "contact": "02-8815-1234", "email": "bgcanimal@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-8pm",
+     "region": "Metro Manila", "city": "Taguig",
+     "emergency": False, "24hours": False},
+    
+    # ===== VISAYAS =====
+    # Cebu
+    {"name": "Animal Kingdom Veterinary Hospital", 
+     "address": "38 Gorordo Avenue, Camputhaw, Cebu City", 
+     "lat": 10.3157, "lng": 123.9054, 
+     "contact": "032-231-4567", "email": "animalkingdomcebu@gmail.com",
+     "services": "24/7 Emergency, Surgery, ICU, Laboratory, Pharmacy",
+     "hours": "24/7",
+     "region": "Visayas", "city": "Cebu City",
+     "emergency": True, "24hours": True},
+    
+    {"name": "Cebu Veterinary Doctors", 
+     "address": "Unit 108-109 Marijoy Building, 306 F. Ramos St. Cebu City", 
+     "lat": 10.3123, "lng": 123.8945, 
+     "contact": "032-254-6789", "email": "cebuvetdoctors@gmail.com",
+     "services": "Vaccination, Checkup, Surgery",
+     "hours": "Mon-Fri 9am-7pm, Sat 9am-5pm",
+     "region": "Visayas", "city": "Cebu City",
+     "emergency": False, "24hours": False},
+    
+    {"name": "A-Z Animal Wellness International", 
+     "address": "Girl Scout of the Philippines Bldg, Governor Cuenco Ave, Banilad, Cebu City", 
+     "lat": 10.3456, "lng": 123.9123, 
+     "contact": "032-238-5678", "email": "azanimalwellness@gmail.com",
+     "services": "Wellness, Surgery, Dental, Laboratory",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Visayas", "city": "Cebu City",
+     "emergency": False, "24hours": False},
+    
+    {"name": "San Roque Animal Clinic", 
+     "address": "P. Nellas St, Poblacion 3, Carcar City, Cebu", 
+     "lat": 10.1123, "lng": 123.6456, 
+     "contact": "032-487-1234", "email": "sanroquevet@gmail.com",
+     "services": "General Practice, Vaccination",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Visayas", "city": "Carcar",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Mandaue Animal Hospital", 
+     "address": "A.S. Fortuna St., Mandaue City, Cebu", 
+     "lat": 10.3345, "lng": 123.9345, 
+     "contact": "032-345-6789", "email": "mandaueanimal@gmail.com",
+     "services": "Surgery, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-8pm",
+     "region": "Visayas", "city": "Mandaue",
+     "emergency": True, "24hours": False},
+    
+    # Iloilo
+    {"name": "Iloilo Veterinary Clinic", 
+     "address": "123 J.M. Basa St., Iloilo City", 
+     "lat": 10.6989, "lng": 122.5678, 
+     "contact": "033-321-4567", "email": "iloilovet@gmail.com",
+     "services": "General Practice, Vaccination",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Visayas", "city": "Iloilo City",
+     "emergency": False, "24hours": False},
+    
+    # Bacolod
+    {"name": "Bacolod Veterinary Hospital", 
+     "address": "45 Lacson Street, Bacolod City", 
+     "lat": 10.6789, "lng": 122.9567, 
+     "contact": "034-432-1098", "email": "bacolodvet@gmail.com",
+     "services": "Surgery, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Visayas", "city": "Bacolod",
+     "emergency": False, "24hours": False},
+    
+    # ===== MINDANAO =====
+    # Cagayan de Oro
+    {"name": "Batinga Animal Medical Center", 
+     "address": "85 Tiano Montalvan St., Cagayan De Oro City", 
+     "lat": 8.4822, "lng": 124.6472, 
+     "contact": "088-856-1234", "email": "batingavet@gmail.com",
+     "services": "Surgery, Emergency, ICU, Laboratory",
+     "hours": "Mon-Sun 8am-8pm, Emergency 24/7",
+     "region": "Mindanao", "city": "Cagayan de Oro",
+     "emergency": True, "24hours": True},
+    
+    {"name": "CDO Pet Doctor", 
+     "address": "Apitong St., Crossing Macanhan, Carmen, Cagayan de Oro", 
+     "lat": 8.4678, "lng": 124.6345, 
+     "contact": "088-323-4567", "email": "cdopetdoctor@gmail.com",
+     "services": "Checkup, Vaccination, Grooming",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Mindanao", "city": "Cagayan de Oro",
+     "emergency": False, "24hours": False},
+    
+    # Davao
+    {"name": "Celestial's Animal Clinic", 
+     "address": "Door 8 Lua Bldg., Mc Arthur Highway, Matina, Davao City", 
+     "lat": 7.0645, "lng": 125.6078, 
+     "contact": "082-297-6543", "email": "celestialvet@gmail.com",
+     "services": "Vaccination, Checkup, Minor Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Mindanao", "city": "Davao City",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Pluma Veterinary Clinic", 
+     "address": "Door 1 & 8, Cabana Arcade Building, J.P. Laurel Ave, Bajada, Davao City", 
+     "lat": 7.0789, "lng": 125.6123, 
+     "contact": "082-221-7890", "email": "plumavet@gmail.com",
+     "services": "General Medicine, Surgery, Laboratory",
+     "hours": "Mon-Sat 9am-7pm",
+     "region": "Mindanao", "city": "Davao City",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Davao Veterinary Specialists", 
+     "address": "345 Quirino Ave., Davao City", 
+     "lat": 7.0890, "lng": 125.6234, 
+     "contact": "082-234-5678", "email": "davaovetspecialists@gmail.com",
+     "services": "Specialist Referrals, Surgery, Internal Medicine",
+     "hours": "Mon-Fri 9am-6pm, Sat 9am-12pm",
+     "region": "Mindanao", "city": "Davao City",
+     "emergency": False, "24hours": False},
+    
+    # General Santos
+    {"name": "General Santos Veterinary Clinic", 
+     "address": "78 J. Catolico Ave., General Santos City", 
+     "lat": 6.1123, "lng": 125.1789, 
+     "contact": "083-554-1234", "email": "gensanvet@gmail.com",
+     "services": "General Practice, Vaccination",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Mindanao", "city": "General Santos",
+     "emergency": False, "24hours": False},
+    
+    # Zamboanga
+    {"name": "Zamboanga Veterinary Hospital", 
+     "address": "56 Veterans Ave., Zamboanga City", 
+     "lat": 6.9123, "lng": 122.0678, 
+     "contact": "062-991-2345", "email": "zambovet@gmail.com",
+     "services": "Surgery, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Mindanao", "city": "Zamboanga",
+     "emergency": False, "24hours": False},
+    
+    # ===== LUZON (Outside Metro Manila) =====
+    # Laguna
+    {"name": "Seven Lakes Veterinary Clinic", 
+     "address": "Colago Ave. Brgy 1-A, San Pablo City, Laguna", 
+     "lat": 14.0736, "lng": 121.3278, 
+     "contact": "049-562-1234", "email": "sevenlakesvet@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Luzon", "city": "San Pablo",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Pet Wonders Veterinary Clinic", 
+     "address": "8 Old National Highway, Nueva, San Pedro City, Laguna", 
+     "lat": 14.3567, "lng": 121.0456, 
+     "contact": "02-8808-1234", "email": "petwonders@gmail.com",
+     "services": "Vaccination, Checkup, Grooming",
+     "hours": "Mon-Sat 9am-7pm, Sun 9am-5pm",
+     "region": "Luzon", "city": "San Pedro",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Los Baños Veterinary Clinic", 
+     "address": "53 Lopez Ave., Los Baños, Laguna", 
+     "lat": 14.1789, "lng": 121.2345, 
+     "contact": "049-536-7890", "email": "lbvet@gmail.com",
+     "services": "General Practice, Laboratory",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Luzon", "city": "Los Baños",
+     "emergency": False, "24hours": False},
+    
+    # Cavite
+    {"name": "Wags and Whiskers Veterinary Clinic", 
+     "address": "216 Aguinaldo Hwy, Biga 2, Silang, Cavite", 
+     "lat": 14.2456, "lng": 120.9789, 
+     "contact": "046-413-5678", "email": "wagsandwhiskers@gmail.com",
+     "services": "Wellness, Grooming, Vaccination",
+     "hours": "Mon-Sat 8am-7pm, Sun 9am-5pm",
+     "region": "Luzon", "city": "Silang",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Cavite Veterinary Clinic", 
+     "address": "123 Emilio Aguinaldo Hwy, Dasmariñas, Cavite", 
+     "lat": 14.3234, "lng": 120.9456, 
+     "contact": "046-432-1098", "email": "cavitevet@gmail.com",
+     "services": "General Practice, Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Luzon", "city": "Dasmariñas",
+     "emergency": False, "24hours": False},
+    
+    # Batangas
+    {"name": "Batangas Veterinary Hospital", 
+     "address": "45 P. Burgos St., Batangas City", 
+     "lat": 13.7567, "lng": 121.0567, 
+     "contact": "043-723-4567", "email": "batangasvet@gmail.com",
+     "services": "Surgery, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Luzon", "city": "Batangas",
+     "emergency": False, "24hours": False},
+    
+    # Baguio
+    {"name": "Naguilian Veterinary Clinic", 
+     "address": "54 Naguilian Rd., Campo Filipino, Baguio City", 
+     "lat": 16.4123, "lng": 120.5934, 
+     "contact": "074-442-1234", "email": "naguilianvet@gmail.com",
+     "services": "Vaccination, Checkup, Surgery",
+     "hours": "Mon-Sat 8am-7pm, Sun 9am-5pm",
+     "region": "Luzon", "city": "Baguio",
+     "emergency": False, "24hours": False},
+    
+    {"name": "Baguio Animal Clinic", 
+     "address": "78 Session Road, Baguio City", 
+     "lat": 16.4123, "lng": 120.5987, 
+     "contact": "074-443-5678", "email": "baguioanimal@gmail.com",
+     "services": "General Practice, Vaccination",
+     "hours": "Mon-Sat 8am-6pm",
+     "region": "Luzon", "city": "Baguio",
+     "emergency": False, "24hours": False},
+    
+    # Pampanga
+    {"name": "Pampanga Veterinary Clinic", 
+     "address": "123 MacArthur Hwy, San Fernando, Pampanga", 
+     "lat": 15.0234, "lng": 120.6987, 
+     "contact": "045-456-7890", "email": "pampangavet@gmail.com",
+     "services": "General Practice, Surgery",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Luzon", "city": "San Fernando",
+     "emergency": False, "24hours": False},
+    
+    # Bulacan
+    {"name": "Bulacan Veterinary Hospital", 
+     "address": "45 Mac Arthur Hwy, Malolos, Bulacan", 
+     "lat": 14.8567, "lng": 120.8234, 
+     "contact": "044-791-2345", "email": "bulacanvet@gmail.com",
+     "services": "Surgery, Vaccination, Laboratory",
+     "hours": "Mon-Sat 8am-7pm",
+     "region": "Luzon", "city": "Malolos",
+     "emergency": False, "24hours": False},
+    
+    # Rizal
+    {"name": "Bethlehem Animal Clinic - Antipolo", 
+     "address": "Unit 1 ACV Bldg., Circumferential Road, Brgy. San Roque, Antipolo, Rizal", 
+     "lat": 14.5987, "lng": 121.1345, 
+     "contact": "02-8632-1234", "email": "bethlehemanimal@gmail.com",
+     "services": "General Practice, Vaccination, Surgery",
+     "hours": "Mon-Sat 8am-7pm, Sun 9am-5pm",
+     "region": "Luzon", "city": "Antipolo",
+     "emergency": False, "24hours": False},
+]
+
+# ===== COMPREHENSIVE PHILIPPINE PET STORES DATABASE =====
+PH_PET_STORES = [
+    # ===== METRO MANILA =====
+    # Pet Express (Major Chain)
+    {"name": "Pet Express - SM Megamall", 
+     "address": "SM Megamall, Mandaluyong City", 
+     "lat": 14.5845, "lng": 121.0567, 
+     "contact": "02-8631-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Mall of Asia", 
+     "address": "SM MOA, Pasay City", 
+     "lat": 14.5356, "lng": 120.9823, 
+     "contact": "02-8556-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM North EDSA", 
+     "address": "SM North EDSA, Quezon City", 
+     "lat": 14.6567, "lng": 121.0321, 
+     "contact": "02-8921-2345", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Fairview", 
+     "address": "SM City Fairview, Quezon City", 
+     "lat": 14.7356, "lng": 121.0589, 
+     "contact": "02-8934-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Southmall", 
+     "address": "SM Southmall, Las Piñas", 
+     "lat": 14.4345, "lng": 121.0123, 
+     "contact": "02-8809-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Manila", 
+     "address": "SM City Manila, Manila", 
+     "lat": 14.5987, "lng": 120.9845, 
+     "contact": "02-8523-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Aura Premier", 
+     "address": "SM Aura, BGC, Taguig", 
+     "lat": 14.5567, "lng": 121.0489, 
+     "contact": "02-8815-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Marikina", 
+     "address": "SM City Marikina, Marikina City", 
+     "lat": 14.6345, "lng": 121.0987, 
+     "contact": "02-8943-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City San Lazaro", 
+     "address": "SM San Lazaro, Manila", 
+     "lat": 14.6123, "lng": 120.9876, 
+     "contact": "02-8732-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Novaliches", 
+     "address": "SM Novaliches, Quezon City", 
+     "lat": 14.6987, "lng": 121.0456, 
+     "contact": "02-8935-6789", "type": "Pet Store"},
+    
+    # Pet Lovers Centre
+    {"name": "Pet Lovers Centre - Robinsons Galleria", 
+     "address": "Robinsons Galleria, Quezon City", 
+     "lat": 14.6045, "lng": 121.0456, 
+     "contact": "02-8632-1098", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Magnolia", 
+     "address": "Robinsons Magnolia, Quezon City", 
+     "lat": 14.6234, "lng": 121.0345, 
+     "contact": "02-8945-6789", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Place Manila", 
+     "address": "Robinsons Place Manila, Manila", 
+     "lat": 14.5789, "lng": 120.9876, 
+     "contact": "02-8523-8901", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Ayala Malls Manila Bay", 
+     "address": "Ayala Malls Manila Bay, Parañaque", 
+     "lat": 14.4987, "lng": 120.9912, 
+     "contact": "02-8808-3456", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Glorietta", 
+     "address": "Glorietta, Makati City", 
+     "lat": 14.5523, "lng": 121.0234, 
+     "contact": "02-8812-5678", "type": "Pet Store"},
+    
+    # Specialty Pet Shops
+    {"name": "Cartimar Pet Center", 
+     "address": "Taft Ave, Pasay City", 
+     "lat": 14.5456, "lng": 120.9945, 
+     "contact": "02-8832-4567", "type": "Pet Market"},
+    
+    {"name": "Tiendesitas Pet Village", 
+     "address": "E. Rodriguez Jr. Ave, Pasig City", 
+     "lat": 14.5867, "lng": 121.0876, 
+     "contact": "02-8637-8901", "type": "Pet Village"},
+    
+    {"name": "Doggo & Catto Pet Shop - Banawe", 
+     "address": "123 Banawe Street, Quezon City", 
+     "lat": 14.6234, "lng": 121.0056, 
+     "contact": "02-8745-6789", "type": "Pet Store"},
+    
+    {"name": "Doggo & Catto - BGC", 
+     "address": "Bonifacio Global City, Taguig", 
+     "lat": 14.5567, "lng": 121.0456, 
+     "contact": "02-8815-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Kingdom - Quezon City", 
+     "address": "59 Visayas Ave, Quezon City", 
+     "lat": 14.6567, "lng": 121.0345, 
+     "contact": "02-8921-2345", "type": "Pet Store"},
+    
+    {"name": "The Pet Project", 
+     "address": "16 Regidor St. Brgy. Tibagan, San Juan City", 
+     "lat": 14.6023, "lng": 121.0321, 
+     "contact": "02-8956-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Stop", 
+     "address": "212 Banawe Street, Quezon City", 
+     "lat": 14.6234, "lng": 121.0067, 
+     "contact": "02-8745-1234", "type": "Pet Store"},
+    
+    {"name": "Furry Friends Pet Shop", 
+     "address": "32 Jupiter St., Makati City", 
+     "lat": 14.5678, "lng": 121.0345, 
+     "contact": "02-8813-5678", "type": "Pet Store"},
+    
+    {"name": "Paws & Claws - Alabang", 
+     "address": "Alabang, Muntinlupa", 
+     "lat": 14.4234, "lng": 121.0432, 
+     "contact": "02-8807-8901", "type": "Pet Store"},
+    
+    {"name": "Animal House Pet Shop", 
+     "address": "Quezon Avenue, Quezon City", 
+     "lat": 14.6456, "lng": 121.0234, 
+     "contact": "02-8923-4567", "type": "Pet Store"},
+    
+    # Walter Mart Pet Express
+    {"name": "Pet Express - Walter Mart Makati", 
+     "address": "Walter Mart, Makati City", 
+     "lat": 14.5634, "lng": 121.0312, 
+     "contact": "02-8812-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Express - Walter Mart Pasig", 
+     "address": "Walter Mart, Pasig City", 
+     "lat": 14.5867, "lng": 121.0890, 
+     "contact": "02-8631-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - Walter Mart Muñoz", 
+     "address": "Walter Mart, Quezon City", 
+     "lat": 14.6589, "lng": 121.0234, 
+     "contact": "02-8923-8901", "type": "Pet Store"},
+    
+    # Other locations
+    {"name": "Pet Express - Festive Mall", 
+     "address": "Festive Mall, Alabang", 
+     "lat": 14.4234, "lng": 121.0456, 
+     "contact": "02-8807-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - Evia Lifestyle Center", 
+     "address": "Evia, Las Piñas", 
+     "lat": 14.4345, "lng": 121.0156, 
+     "contact": "02-8808-5678", "type": "Pet Store"},
+    
+    # ===== LUZON (Outside Metro Manila) =====
+    # Cavite
+    {"name": "Pet Express - SM City Dasmariñas", 
+     "address": "SM City Dasmariñas, Cavite", 
+     "lat": 14.3234, "lng": 120.9456, 
+     "contact": "046-432-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Bacoor", 
+     "address": "SM City Bacoor, Cavite", 
+     "lat": 14.4567, "lng": 120.9789, 
+     "contact": "046-417-8901", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Molino", 
+     "address": "SM City Molino, Cavite", 
+     "lat": 14.3987, "lng": 120.9789, 
+     "contact": "046-417-1234", "type": "Pet Store"},
+    
+    {"name": "Paws & Claws Pet Shop - Dasmariñas", 
+     "address": "Aguinaldo Highway, Dasmariñas, Cavite", 
+     "lat": 14.3234, "lng": 120.9456, 
+     "contact": "046-432-1234", "type": "Pet Store"},
+    
+    # Laguna
+    {"name": "Pet Express - SM City Santa Rosa", 
+     "address": "SM City Santa Rosa, Laguna", 
+     "lat": 14.3123, "lng": 121.1123, 
+     "contact": "049-543-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Calamba", 
+     "address": "SM City Calamba, Laguna", 
+     "lat": 14.2123, "lng": 121.1567, 
+     "contact": "049-545-6789", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Nuvali", 
+     "address": "Solenad, Nuvali, Laguna", 
+     "lat": 14.2456, "lng": 121.0890, 
+     "contact": "049-502-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Stop - Los Baños", 
+     "address": "Los Baños, Laguna", 
+     "lat": 14.1789, "lng": 121.2345, 
+     "contact": "049-536-7890", "type": "Pet Store"},
+    
+    # Batangas
+    {"name": "Pet Express - SM City Lipa", 
+     "address": "SM City Lipa, Batangas", 
+     "lat": 13.9456, "lng": 121.1678, 
+     "contact": "043-756-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Batangas", 
+     "address": "SM City Batangas, Batangas", 
+     "lat": 13.7567, "lng": 121.0567, 
+     "contact": "043-723-4567", "type": "Pet Store"},
+    
+    # Bulacan
+    {"name": "Pet Express - SM City Marilao", 
+     "address": "SM City Marilao, Bulacan", 
+     "lat": 14.7567, "lng": 120.9567, 
+     "contact": "044-813-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Baliwag", 
+     "address": "SM City Baliwag, Bulacan", 
+     "lat": 14.9567, "lng": 120.8987, 
+     "contact": "044-766-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City San Jose Del Monte", 
+     "address": "SM City San Jose Del Monte, Bulacan", 
+     "lat": 14.8234, "lng": 121.0456, 
+     "contact": "044-691-7890", "type": "Pet Store"},
+    
+    # Pampanga
+    {"name": "Pet Express - SM City Pampanga", 
+     "address": "SM City Pampanga, San Fernando", 
+     "lat": 15.0234, "lng": 120.6987, 
+     "contact": "045-456-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Clark", 
+     "address": "SM City Clark, Angeles City", 
+     "lat": 15.1567, "lng": 120.5890, 
+     "contact": "045-499-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Starmills", 
+     "address": "Robinsons Starmills, San Fernando", 
+     "lat": 15.0234, "lng": 120.7012, 
+     "contact": "045-456-1234", "type": "Pet Store"},
+    
+    # Baguio
+    {"name": "Pet Express - SM City Baguio", 
+     "address": "SM City Baguio, Baguio City", 
+     "lat": 16.4123, "lng": 120.5934, 
+     "contact": "074-442-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Stop - Baguio", 
+     "address": "Session Road, Baguio City", 
+     "lat": 16.4123, "lng": 120.5987, 
+     "contact": "074-443-1234", "type": "Pet Store"},
+    
+    # Rizal
+    {"name": "Pet Express - SM City Taytay", 
+     "address": "SM City Taytay, Rizal", 
+     "lat": 14.5678, "lng": 121.1345, 
+     "contact": "02-8632-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Masinag", 
+     "address": "SM City Masinag, Antipolo", 
+     "lat": 14.6345, "lng": 121.1567, 
+     "contact": "02-8635-7890", "type": "Pet Store"},
+    
+    # ===== VISAYAS =====
+    # Cebu
+    {"name": "Pet Express - SM City Cebu", 
+     "address": "SM City Cebu, Cebu City", 
+     "lat": 10.3123, "lng": 123.9156, 
+     "contact": "032-231-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Seaside City Cebu", 
+     "address": "SM Seaside, Cebu City", 
+     "lat": 10.2890, "lng": 123.9012, 
+     "contact": "032-234-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City Consolacion", 
+     "address": "SM City Consolacion, Cebu", 
+     "lat": 10.3987, "lng": 123.9789, 
+     "contact": "032-234-8901", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Ayala Center Cebu", 
+     "address": "Ayala Center, Cebu City", 
+     "lat": 10.3157, "lng": 123.9054, 
+     "contact": "032-238-9012", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Galleria Cebu", 
+     "address": "Robinsons Galleria, Cebu City", 
+     "lat": 10.3345, "lng": 123.9345, 
+     "contact": "032-345-6789", "type": "Pet Store"},
+    
+    {"name": "Pet Stop - Cebu", 
+     "address": "Mango Avenue, Cebu City", 
+     "lat": 10.3157, "lng": 123.9089, 
+     "contact": "032-253-4567", "type": "Pet Store"},
+    
+    {"name": "Dog Lovers Paradise", 
+     "address": "Banilad, Cebu City", 
+     "lat": 10.3456, "lng": 123.9123, 
+     "contact": "032-238-5678", "type": "Pet Store"},
+    
+    {"name": "Pets in Style - Cebu", 
+     "address": "Mandaue City, Cebu", 
+     "lat": 10.3345, "lng": 123.9378, 
+     "contact": "032-346-7890", "type": "Pet Store"},
+    
+    # Iloilo
+    {"name": "Pet Express - SM City Iloilo", 
+     "address": "SM City Iloilo, Iloilo City", 
+     "lat": 10.6989, "lng": 122.5678, 
+     "contact": "033-321-4567", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Delgado", 
+     "address": "SM Delgado, Iloilo City", 
+     "lat": 10.7012, "lng": 122.5690, 
+     "contact": "033-321-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Place Iloilo", 
+     "address": "Robinsons Place Iloilo", 
+     "lat": 10.6989, "lng": 122.5701, 
+     "contact": "033-322-1234", "type": "Pet Store"},
+    
+    # Bacolod
+    {"name": "Pet Express - SM City Bacolod", 
+     "address": "SM City Bacolod, Bacolod City", 
+     "lat": 10.6789, "lng": 122.9567, 
+     "contact": "034-432-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - Ayala Malls Capitol Central", 
+     "address": "Ayala Malls, Bacolod City", 
+     "lat": 10.6789, "lng": 122.9589, 
+     "contact": "034-433-7890", "type": "Pet Store"},
+    
+    # ===== MINDANAO =====
+    # Davao
+    {"name": "Pet Express - SM City Davao", 
+     "address": "SM City Davao, Davao City", 
+     "lat": 7.0789, "lng": 125.6123, 
+     "contact": "082-234-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Lanang Premier", 
+     "address": "SM Lanang, Davao City", 
+     "lat": 7.0890, "lng": 125.6234, 
+     "contact": "082-235-6789", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM Ecoland", 
+     "address": "SM Ecoland, Davao City", 
+     "lat": 7.0645, "lng": 125.6078, 
+     "contact": "082-297-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Abreeza Mall", 
+     "address": "Abreeza Mall, Davao City", 
+     "lat": 7.0789, "lng": 125.6145, 
+     "contact": "082-236-7890", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Gaisano Mall", 
+     "address": "Gaisano Mall, Davao City", 
+     "lat": 7.0789, "lng": 125.6090, 
+     "contact": "082-221-3456", "type": "Pet Store"},
+    
+    {"name": "Paws & Claws - Davao", 
+     "address": "Ecoland, Davao City", 
+     "lat": 7.0645, "lng": 125.6078, 
+     "contact": "082-297-8901", "type": "Pet Store"},
+    
+    # Cagayan de Oro
+    {"name": "Pet Express - SM City CDO Uptown", 
+     "address": "SM City CDO Uptown, Cagayan de Oro", 
+     "lat": 8.4822, "lng": 124.6472, 
+     "contact": "088-856-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Express - SM City CDO Downtown", 
+     "address": "SM City CDO Downtown, Cagayan de Oro", 
+     "lat": 8.4745, "lng": 124.6423, 
+     "contact": "088-857-5678", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Centrio Mall", 
+     "address": "Centrio Mall, Cagayan de Oro", 
+     "lat": 8.4822, "lng": 124.6489, 
+     "contact": "088-856-7890", "type": "Pet Store"},
+    
+    {"name": "The Pet Project - CDO", 
+     "address": "Uptown, Cagayan de Oro", 
+     "lat": 8.4822, "lng": 124.6501, 
+     "contact": "088-856-3456", "type": "Pet Store"},
+    
+    # General Santos
+    {"name": "Pet Express - SM City General Santos", 
+     "address": "SM City GenSan, General Santos City", 
+     "lat": 6.1123, "lng": 125.1789, 
+     "contact": "083-554-1234", "type": "Pet Store"},
+    
+    {"name": "Pet Lovers Centre - Robinsons Place GenSan", 
+     "address": "Robinsons Place GenSan", 
+     "lat": 6.1134, "lng": 125.1801, 
+     "contact": "083-552-4567", "type": "Pet Store"},
+    
+    # Zamboanga
+    {"name": "Pet Express - SM City Mindpro", 
+     "address": "SM Mindpro, Zamboanga City", 
+     "lat": 6.9123, "lng": 122.0678, 
+     "contact": "062-991-2345", "type": "Pet Store"},
+    
+    {"name": "Pet Express - KCC Mall de Zamboanga", 
+     "address": "KCC Mall, Zamboanga City", 
+     "lat": 6.9134, "lng": 122.0690, 
+     "contact": "062-992-3456", "type": "Pet Store"},
+]
+
+# ========== CATALOGUE SEEDING ==========
+# catalogue_version.version moves on every clinic/store write so a running
+# app knows when to reload its in-memory copy. While held_until is in the
+# future (seconds since the epoch by the database's clock) the triggers leave
+# it alone: a bulk import holds it and bumps it once when done.
+CATALOGUE_CLOCK_SQL = {
+    'sqlite': "CAST(strftime('%s', 'now') AS REAL)",
+    'postgresql': "extract(epoch FROM clock_timestamp())",
+}
+CATALOGUE_VERSION_SQL = [
+    """CREATE TABLE IF NOT EXISTS catalogue_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0,
+        held_until DOUBLE PRECISION
+    )""",
+    "INSERT INTO catalogue_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+]
+CATALOGUE_VERSION_TRIGGERS = []
+for _table in ('vet_clinics', 'pet_stores'):
+    for _event in ('INSERT', 'UPDATE', 'DELETE'):
+        CATALOGUE_VERSION_TRIGGERS.append(f"{_table}_{_event.lower()}_version")
+        CATALOGUE_VERSION_SQL.append(f"""CREATE TRIGGER IF NOT EXISTS {_table}_{_event.lower()}_version
+        AFTER {_event} ON {_table}
+        BEGIN
+            UPDATE catalogue_version SET version = version + 1
+            WHERE id = 1 AND COALESCE(held_until, 0) < {CATALOGUE_CLOCK_SQL['sqlite']};
+        END""")
 
-def init_database():
-    conn = sqlite3.connect('petcare.db')
-    cursor = conn.cursor()
-    
-    print("🗑️ Cleaning old tables...")
-    cursor.execute("DROP TABLE IF EXISTS users")
-    cursor.execute("DROP TABLE IF EXISTS vet_clinics")
-    cursor.execute("DROP TABLE IF EXISTS pet_stores")
-    
-    print("📦 Creating tables...")
-    
-    # Users table
-    cursor.execute('''
-    CREATE TABLE users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT UNIQUE NOT NULL,
-        password TEXT NOT NULL,
-        email TEXT UNIQUE NOT NULL,
-        full_name TEXT NOT NULL,
-        address TEXT,
-        latitude REAL DEFAULT 14.5995,
-        longitude REAL DEFAULT 120.9842,
-        contact TEXT,
-        pet_info TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        last_login TIMESTAMP
-    )
-    ''')
-    
-    # Vet clinics table (for registered clinics)
-    cursor.execute('''
-    CREATE TABLE vet_clinics (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        clinic_name TEXT NOT NULL,
-        address TEXT NOT NULL,
-        latitude REAL NOT NULL,
-        longitude REAL NOT NULL,
-        contact TEXT,
-        email TEXT,
-        services TEXT,
-        operating_hours TEXT,
-        region TEXT,
-        city TEXT,
-        is_emergency BOOLEAN DEFAULT 0,
-        is_24hours BOOLEAN DEFAULT 0,
-        verified BOOLEAN DEFAULT 1,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    # Pet stores table (for registered stores)
-    cursor.execute('''
-    CREATE TABLE pet_stores (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        store_name TEXT NOT NULL,
-        address TEXT NOT NULL,
-        latitude REAL NOT NULL,
-        longitude REAL NOT NULL,
-        contact TEXT,
-        store_type TEXT,
-        verified BOOLEAN DEFAULT 1,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
-    
-    print("👤 Inserting sample users...")
-    
-    # Sample users
-    users = [
-        ('john_doe', hash_password('password123'), 'john.doe@email.com', 'John Doe', 'Manila', '09171234567', 'Labrador named Max'),
-        ('jane_smith', hash_password('password123'), 'jane.smith@email.com', 'Jane Smith', 'Quezon City', '09181234567', '2 Persian cats'),
-        ('mike_wilson', hash_password('password123'), 'mike.wilson@email.com', 'Mike Wilson', 'Makati', '09191234567', 'Beagle and Parrot'),
-        ('maria_santos', hash_password('password123'), 'maria.santos@email.com', 'Maria Santos', 'Cebu City', '09201234567', 'Shih Tzu puppy'),
-        ('pedro_reyes', hash_password('password123'), 'pedro.reyes@email.com', 'Pedro Reyes', 'Davao City', '09211234567', '2 Aspins')
+# <table>_rtree mirrors each clinic/store point as a degenerate box so
+# radius searches can prefilter by bounding box inside SQLite
+CATALOGUE_RTREE_SQL = []
+CATALOGUE_RTREE_FILL_SQL = []  # rows the mirror is missing, e.g. after the table was loaded without triggers
+for _table in ('vet_clinics', 'pet_stores'):
+    CATALOGUE_RTREE_FILL_SQL.append(
+        f"""INSERT INTO {_table}_rtree (id, min_lat, max_lat, min_lng, max_lng)
+        SELECT id, latitude, latitude, longitude, longitude FROM {_table}
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+          AND id NOT IN (SELECT id FROM {_table}_rtree)""")
+    CATALOGUE_RTREE_SQL += [
+        f"""CREATE VIRTUAL TABLE IF NOT EXISTS {_table}_rtree USING rtree(
+            id, min_lat, max_lat, min_lng, max_lng
+        )""",
+        f"""CREATE TRIGGER IF NOT EXISTS {_table}_rtree_insert
+        AFTER INSERT ON {_table}
+        WHEN new.latitude IS NOT NULL AND new.longitude IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO {_table}_rtree VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {_table}_rtree_update
+        AFTER UPDATE OF id, latitude, longitude ON {_table}
+        BEGIN
+            DELETE FROM {_table}_rtree WHERE id = old.id;
+            INSERT INTO {_table}_rtree
+            SELECT new.id, new.latitude, new.latitude, new.longitude, new.longitude
+            WHERE new.latitude IS NOT NULL AND new.longitude IS NOT NULL;
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {_table}_rtree_delete
+        AFTER DELETE ON {_table}
+        BEGIN
+            DELETE FROM {_table}_rtree WHERE id = old.id;
+        END""",
     ]
+
+# PostgreSQL keeps the same counter, bumped by one statement-level trigger per table
+CATALOGUE_VERSION_PG_SQL = CATALOGUE_VERSION_SQL[:2] + [
+    f"""CREATE OR REPLACE FUNCTION bump_catalogue_version() RETURNS trigger AS $$
+    BEGIN
+        UPDATE catalogue_version SET version = version + 1
+        WHERE id = 1 AND COALESCE(held_until, 0) < {CATALOGUE_CLOCK_SQL['postgresql']};
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql""",
+]
+for _table in ('vet_clinics', 'pet_stores'):
+    CATALOGUE_VERSION_PG_SQL.append(f"""DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = '{_table}_version') THEN
+            CREATE TRIGGER {_table}_version AFTER INSERT OR UPDATE OR DELETE ON {_table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version();
+        END IF;
+    END $$""")
+
+# PostgreSQL's equivalent of the R*Tree mirrors: a GiST index on each point
+# (earthdistance), which radius searches hit through earth_box(...) @> ...
+CATALOGUE_EARTH_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS cube",
+    "CREATE EXTENSION IF NOT EXISTS earthdistance",
+] + [
+    f"CREATE INDEX IF NOT EXISTS {_table}_earth ON {_table} USING gist (ll_to_earth(latitude, longitude))"
+    for _table in ('vet_clinics', 'pet_stores')
+]
+
+def create_catalogue_triggers(cursor, dialect='sqlite'):
+    """Create the catalogue_version counter, the R*Tree mirrors and the triggers keeping them current"""
+    if dialect == 'postgresql':
+        statements = CATALOGUE_VERSION_PG_SQL
+    else:
+        statements = CATALOGUE_VERSION_SQL + CATALOGUE_RTREE_SQL + CATALOGUE_RTREE_FILL_SQL
+    for statement in statements:
+        cursor.execute(statement)
+
+def seed_catalogue(cursor, dialect='sqlite'):
+    """Insert the built-in clinics/stores into whichever catalogue table is still empty"""
+    mark = '%s' if dialect == 'postgresql' else '?'  # the DB-API paramstyle of psycopg2 / sqlite3
+    cursor.execute("SELECT COUNT(*) FROM vet_clinics")
+    if cursor.fetchone()[0] == 0:
+        cursor.executemany(f'''
+        INSERT INTO vet_clinics (clinic_name, address, latitude, longitude, contact, email, services,
+                                 operating_hours, region, city, is_emergency, is_24hours, verified)
+        VALUES ({', '.join([mark] * 12)}, TRUE)
+        ''', [(c["name"], c["address"], c["lat"], c["lng"], c["contact"], c["email"], c["services"],
+               c["hours"], c["region"], c["city"], c["emergency"], c["24hours"]) for c in PH_VET_CLINICS])
     
-    cursor.executemany('''
-    INSERT INTO users (username, password, email, full_name, address, contact, pet_info)
-    VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', users)
-    
-    print("🏪 Inserting comprehensive Philippine pet stores...")
-    
-    # Comprehensive Philippine pet stores data (85+ stores)
-    pet_stores = [
-        # ===== METRO MANILA =====
-        # Pet Express (Major Chain)
-        ('Pet Express - SM Megamall', 'SM Megamall, Mandaluyong City', 14.5845, 121.0567, '02-8631-1234', 'Pet Store', 1),
-        ('Pet Express - SM Mall of Asia', 'SM MOA, Pasay City', 14.5356, 120.9823, '02-8556-7890', 'Pet Store', 1),
-        ('Pet Express - SM North EDSA', 'SM North EDSA, Quezon City', 14.6567, 121.0321, '02-8921-2345', 'Pet Store', 1),
-        ('Pet Express - SM Fairview', 'SM City Fairview, Quezon City', 14.7356, 121.0589, '02-8934-5678', 'Pet Store', 1),
-        ('Pet Express - SM Southmall', 'SM Southmall, Las Piñas', 14.4345, 121.0123, '02-8809-1234', 'Pet Store', 1),
-        ('Pet Express - SM City Manila', 'SM City Manila, Manila', 14.5987, 120.9845, '02-8523-4567', 'Pet Store', 1),
-        ('Pet Express - SM Aura Premier', 'SM Aura, BGC, Taguig', 14.5567, 121.0489, '02-8815-7890', 'Pet Store', 1),
-        ('Pet Express - SM City Marikina', 'SM City Marikina, Marikina City', 14.6345, 121.0987, '02-8943-5678', 'Pet Store', 1),
-        ('Pet Express - SM City San Lazaro', 'SM San Lazaro, Manila', 14.6123, 120.9876, '02-8732-4567', 'Pet Store', 1),
-        ('Pet Express - SM City Novaliches', 'SM Novaliches, Quezon City', 14.6987, 121.0456, '02-8935-6789', 'Pet Store', 1),
-        
-        # Pet Lovers Centre
-        ('Pet Lovers Centre - Robinsons Galleria', 'Robinsons Galleria, Quezon City', 14.6045, 121.0456, '02-8632-1098', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Magnolia', 'Robinsons Magnolia, Quezon City', 14.6234, 121.0345, '02-8945-6789', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Place Manila', 'Robinsons Place Manila, Manila', 14.5789, 120.9876, '02-8523-8901', 'Pet Store', 1),
-        ('Pet Lovers Centre - Ayala Malls Manila Bay', 'Ayala Malls Manila Bay, Parañaque', 14.4987, 120.9912, '02-8808-3456', 'Pet Store', 1),
-        ('Pet Lovers Centre - Glorietta', 'Glorietta, Makati City', 14.5523, 121.0234, '02-8812-5678', 'Pet Store', 1),
-        
-        # Specialty Pet Shops
-        ('Cartimar Pet Center', 'Taft Ave, Pasay City', 14.5456, 120.9945, '02-8832-4567', 'Pet Market', 1),
-        ('Tiendesitas Pet Village', 'E. Rodriguez Jr. Ave, Pasig City', 14.5867, 121.0876, '02-8637-8901', 'Pet Village', 1),
-        ('Doggo & Catto Pet Shop - Banawe', '123 Banawe Street, Quezon City', 14.6234, 121.0056, '02-8745-6789', 'Pet Store', 1),
-        ('Doggo & Catto - BGC', 'Bonifacio Global City, Taguig', 14.5567, 121.0456, '02-8815-1234', 'Pet Store', 1),
-        ('Pet Kingdom - Quezon City', '59 Visayas Ave, Quezon City', 14.6567, 121.0345, '02-8921-2345', 'Pet Store', 1),
-        ('The Pet Project', '16 Regidor St. Brgy. Tibagan, San Juan City', 14.6023, 121.0321, '02-8956-7890', 'Pet Store', 1),
-        ('Pet Stop', '212 Banawe Street, Quezon City', 14.6234, 121.0067, '02-8745-1234', 'Pet Store', 1),
-        ('Furry Friends Pet Shop', '32 Jupiter St., Makati City', 14.5678, 121.0345, '02-8813-5678', 'Pet Store', 1),
-        ('Paws & Claws - Alabang', 'Alabang, Muntinlupa', 14.4234, 121.0432, '02-8807-8901', 'Pet Store', 1),
-        
-        # Walter Mart Pet Express
-        ('Pet Express - Walter Mart Makati', 'Walter Mart, Makati City', 14.5634, 121.0312, '02-8812-7890', 'Pet Store', 1),
-        ('Pet Express - Walter Mart Pasig', 'Walter Mart, Pasig City', 14.5867, 121.0890, '02-8631-4567', 'Pet Store', 1),
-        ('Pet Express - Walter Mart Muñoz', 'Walter Mart, Quezon City', 14.6589, 121.0234, '02-8923-8901', 'Pet Store', 1),
-        ('Pet Express - Festive Mall', 'Festive Mall, Alabang', 14.4234, 121.0456, '02-8807-1234', 'Pet Store', 1),
-        ('Pet Express - Evia Lifestyle Center', 'Evia, Las Piñas', 14.4345, 121.0156, '02-8808-5678', 'Pet Store', 1),
-        
-        # ===== LUZON (Outside Metro Manila) =====
-        # Cavite
-        ('Pet Express - SM City Dasmariñas', 'SM City Dasmariñas, Cavite', 14.3234, 120.9456, '046-432-5678', 'Pet Store', 1),
-        ('Pet Express - SM City Bacoor', 'SM City Bacoor, Cavite', 14.4567, 120.9789, '046-417-8901', 'Pet Store', 1),
-        ('Pet Express - SM City Molino', 'SM City Molino, Cavite', 14.3987, 120.9789, '046-417-1234', 'Pet Store', 1),
-        ('Paws & Claws Pet Shop - Dasmariñas', 'Aguinaldo Highway, Dasmariñas, Cavite', 14.3234, 120.9456, '046-432-1234', 'Pet Store', 1),
-        
-        # Laguna
-        ('Pet Express - SM City Santa Rosa', 'SM City Santa Rosa, Laguna', 14.3123, 121.1123, '049-543-4567', 'Pet Store', 1),
-        ('Pet Express - SM City Calamba', 'SM City Calamba, Laguna', 14.2123, 121.1567, '049-545-6789', 'Pet Store', 1),
-        ('Pet Lovers Centre - Nuvali', 'Solenad, Nuvali, Laguna', 14.2456, 121.0890, '049-502-1234', 'Pet Store', 1),
-        ('Pet Stop - Los Baños', 'Los Baños, Laguna', 14.1789, 121.2345, '049-536-7890', 'Pet Store', 1),
-        
-        # Batangas
-        ('Pet Express - SM City Lipa', 'SM City Lipa, Batangas', 13.9456, 121.1678, '043-756-1234', 'Pet Store', 1),
-        ('Pet Express - SM City Batangas', 'SM City Batangas, Batangas', 13.7567, 121.0567, '043-723-4567', 'Pet Store', 1),
-        
-        # Bulacan
-        ('Pet Express - SM City Marilao', 'SM City Marilao, Bulacan', 14.7567, 120.9567, '044-813-4567', 'Pet Store', 1),
-        ('Pet Express - SM City Baliwag', 'SM City Baliwag, Bulacan', 14.9567, 120.8987, '044-766-1234', 'Pet Store', 1),
-        ('Pet Express - SM City San Jose Del Monte', 'SM City San Jose Del Monte, Bulacan', 14.8234, 121.0456, '044-691-7890', 'Pet Store', 1),
-        
-        # Pampanga
-        ('Pet Express - SM City Pampanga', 'SM City Pampanga, San Fernando', 15.0234, 120.6987, '045-456-7890', 'Pet Store', 1),
-        ('Pet Express - SM City Clark', 'SM City Clark, Angeles City', 15.1567, 120.5890, '045-499-1234', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Starmills', 'Robinsons Starmills, San Fernando', 15.0234, 120.7012, '045-456-1234', 'Pet Store', 1),
+    cursor.execute("SELECT COUNT(*) FROM pet_stores")
+    if cursor.fetchone()[0] == 0:
+        cursor.executemany(f'''
+        INSERT INTO pet_stores (store_name, address, latitude, longitude, contact, store_type, verified)
+        VALUES ({', '.join([mark] * 6)}, TRUE)
+        ''', [(p["name"], p["address"], p["lat"], p["lng"], p["contact"], p["type"]) for p in PH_PET_STORES])
+
+def init_database(reset=False):
+    """Bring the app's database (DATABASE_URL, or instance/petcare.db) up to the
+    current schema and add the sample data it is missing; existing rows are kept
+    unless reset is set"""
+    from app import app, db, hash_password, migrate  # app imports this module for the seed data
+    
+    with app.app_context():
+        if reset:
+            print("🗑️ Dropping every table (--reset)...")
+            with db.engine.begin() as conn:
+                for table in ('vet_clinics_rtree', 'pet_stores_rtree', 'catalogue_version', 'schema_migrations', 'sessions'):
+                    conn.execute(db.text(f"DROP TABLE IF EXISTS {table}"))
+            db.drop_all()
         
-        # Baguio
-        ('Pet Express - SM City Baguio', 'SM City Baguio, Baguio City', 16.4123, 120.5934, '074-442-5678', 'Pet Store', 1),
-        ('Pet Stop - Baguio', 'Session Road, Baguio City', 16.4123, 120.5987, '074-443-1234', 'Pet Store', 1),
+        print("📦 Applying schema migrations...")
+        if not migrate():
+            print("   • Schema already up to date")
         
-        # Rizal
-        ('Pet Express - SM City Taytay', 'SM City Taytay, Rizal', 14.5678, 121.1345, '02-8632-5678', 'Pet Store', 1),
-        ('Pet Express - SM City Masinag', 'SM City Masinag, Antipolo', 14.6345, 121.1567, '02-8635-7890', 'Pet Store', 1),
+        print("👤 Inserting sample users...")
         
-        # ===== VISAYAS =====
-        # Cebu
-        ('Pet Express - SM City Cebu', 'SM City Cebu, Cebu City', 10.3123, 123.9156, '032-231-7890', 'Pet Store', 1),
-        ('Pet Express - SM Seaside City Cebu', 'SM Seaside, Cebu City', 10.2890, 123.9012, '032-234-5678', 'Pet Store', 1),
-        ('Pet Express - SM City Consolacion', 'SM City Consolacion, Cebu', 10.3987, 123.9789, '032-234-8901', 'Pet Store', 1),
-        ('Pet Lovers Centre - Ayala Center Cebu', 'Ayala Center, Cebu City', 10.3157, 123.9054, '032-238-9012', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Galleria Cebu', 'Robinsons Galleria, Cebu City', 10.3345, 123.9345, '032-345-6789', 'Pet Store', 1),
-        ('Pet Stop - Cebu', 'Mango Avenue, Cebu City', 10.3157, 123.9089, '032-253-4567', 'Pet Store', 1),
-        ('Dog Lovers Paradise', 'Banilad, Cebu City', 10.3456, 123.9123, '032-238-5678', 'Pet Store', 1),
-        ('Pets in Style - Cebu', 'Mandaue City, Cebu', 10.3345, 123.9378, '032-346-7890', 'Pet Store', 1),
+        # Sample users
+        users = [
+            ('john_doe', hash_password('password123'), 'john.doe@email.com', 'John Doe', 'Manila', '09171234567', 'Labrador named Max'),
+            ('jane_smith', hash_password('password123'), 'jane.smith@email.com', 'Jane Smith', 'Quezon City', '09181234567', '2 Persian cats'),
+            ('mike_wilson', hash_password('password123'), 'mike.wilson@email.com', 'Mike Wilson', 'Makati', '09191234567', 'Beagle and Parrot'),
+            ('maria_santos', hash_password('password123'), 'maria.santos@email.com', 'Maria Santos', 'Cebu City', '09201234567', 'Shih Tzu puppy'),
+            ('pedro_reyes', hash_password('password123'), 'pedro.reyes@email.com', 'Pedro Reyes', 'Davao City', '09211234567', '2 Aspins')
+        ]
         
-        # Iloilo
-        ('Pet Express - SM City Iloilo', 'SM City Iloilo, Iloilo City', 10.6989, 122.5678, '033-321-4567', 'Pet Store', 1),
-        ('Pet Express - SM Delgado', 'SM Delgado, Iloilo City', 10.7012, 122.5690, '033-321-7890', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Place Iloilo', 'Robinsons Place Iloilo', 10.6989, 122.5701, '033-322-1234', 'Pet Store', 1),
+        # Accounts that already exist (same email or username) are left alone
+        with db.engine.begin() as conn:
+            conn.execute(db.text('''
+            INSERT INTO users (username, password, email, full_name, address, contact, pet_info, latitude, longitude, created_at)
+            VALUES (:username, :password, :email, :full_name, :address, :contact, :pet_info, 14.5995, 120.9842, CURRENT_TIMESTAMP)
+            ON CONFLICT DO NOTHING
+            '''), [dict(zip(('username', 'password', 'email', 'full_name', 'address', 'contact', 'pet_info'), user))
+                   for user in users])
         
-        # Bacolod
-        ('Pet Express - SM City Bacolod', 'SM City Bacolod, Bacolod City', 10.6789, 122.9567, '034-432-5678', 'Pet Store', 1),
-        ('Pet Express - Ayala Malls Capitol Central', 'Ayala Malls, Bacolod City', 10.6789, 122.9589, '034-433-7890', 'Pet Store', 1),
+        print("🏥 Inserting Philippine vet clinics and pet stores...")
+        conn = db.engine.raw_connection()
+        try:
+            seed_catalogue(conn.cursor(), db.engine.dialect.name)
+            conn.commit()
+        finally:
+            conn.close()
         
-        # ===== MINDANAO =====
-        # Davao
-        ('Pet Express - SM City Davao', 'SM City Davao, Davao City', 7.0789, 125.6123, '082-234-5678', 'Pet Store', 1),
-        ('Pet Express - SM Lanang Premier', 'SM Lanang, Davao City', 7.0890, 125.6234, '082-235-6789', 'Pet Store', 1),
-        ('Pet Express - SM Ecoland', 'SM Ecoland, Davao City', 7.0645, 125.6078, '082-297-1234', 'Pet Store', 1),
-        ('Pet Lovers Centre - Abreeza Mall', 'Abreeza Mall, Davao City', 7.0789, 125.6145, '082-236-7890', 'Pet Store', 1),
-        ('Pet Lovers Centre - Gaisano Mall', 'Gaisano Mall, Davao City', 7.0789, 125.6090, '082-221-3456', 'Pet Store', 1),
-        ('Paws & Claws - Davao', 'Ecoland, Davao City', 7.0645, 125.6078, '082-297-8901', 'Pet Store', 1),
+        print("\n✅ DATABASE INITIALIZED SUCCESSFULLY!")
+        print("="*60)
+        print("📊 SAMPLE USER LOGINS:")
+        print("-"*40)
+        emails = [user[2] for user in users]
+        rows = db.session.execute(db.text("SELECT email, full_name FROM users"))
+        for email, name in rows:
+            if email in emails:
+                print(f"   📧 {email} (password: password123) - {name}")
         
-        # Cagayan de Oro
-        ('Pet Express - SM City CDO Uptown', 'SM City CDO Uptown, Cagayan de Oro', 8.4822, 124.6472, '088-856-1234', 'Pet Store', 1),
-        ('Pet Express - SM City CDO Downtown', 'SM City CDO Downtown, Cagayan de Oro', 8.4745, 124.6423, '088-857-5678', 'Pet Store', 1),
-        ('Pet Lovers Centre - Centrio Mall', 'Centrio Mall, Cagayan de Oro', 8.4822, 124.6489, '088-856-7890', 'Pet Store', 1),
-        ('The Pet Project - CDO', 'Uptown, Cagayan de Oro', 8.4822, 124.6501, '088-856-3456', 'Pet Store', 1),
+        print("\n" + "="*60)
+        print("🏪 PET STORES ADDED:")
+        print("-"*40)
+        store_count = db.session.execute(db.text("SELECT COUNT(*) FROM pet_stores")).scalar()
+        print(f"   📊 Total pet stores: {store_count}")
         
-        # General Santos
-        ('Pet Express - SM City General Santos', 'SM City GenSan, General Santos City', 6.1123, 125.1789, '083-554-1234', 'Pet Store', 1),
-        ('Pet Lovers Centre - Robinsons Place GenSan', 'Robinsons Place GenSan', 6.1134, 125.1801, '083-552-4567', 'Pet Store', 1),
+        # Count by store type
+        for store_type, count in db.session.execute(db.text("SELECT store_type, COUNT(*) FROM pet_stores GROUP BY store_type")):
+            print(f"   • {store_type}: {count}")
         
-        # Zamboanga
-        ('Pet Express - SM City Mindpro', 'SM Mindpro, Zamboanga City', 6.9123, 122.0678, '062-991-2345', 'Pet Store', 1),
-        ('Pet Express - KCC Mall de Zamboanga', 'KCC Mall, Zamboanga City', 6.9134, 122.0690, '062-992-3456', 'Pet Store', 1),
-    ]
-    
-    cursor.executemany('''
-    INSERT INTO pet_stores (store_name, address, latitude, longitude, contact, store_type, verified)
-    VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', pet_stores)
-    
-    conn.commit()
-    
-    print("\n✅ DATABASE INITIALIZED SUCCESSFULLY!")
-    print("="*60)
-    print("📊 SAMPLE USER LOGINS:")
-    print("-"*40)
-    cursor.execute("SELECT email, full_name FROM users")
-    for email, name in cursor.fetchall():
-        print(f"   📧 {email} (password: password123) - {name}")
-    
-    print("\n" + "="*60)
-    print("🏪 PET STORES ADDED:")
-    print("-"*40)
-    cursor.execute("SELECT COUNT(*) FROM pet_stores")
-    store_count = cursor.fetchone()[0]
-    print(f"   📊 Total pet stores: {store_count}")
-    
-    # Count by store type
-    cursor.execute("SELECT store_type, COUNT(*) FROM pet_stores GROUP BY store_type")
-    for store_type, count in cursor.fetchall():
-        print(f"   • {store_type}: {count}")
-    
-    # Count by region (approximate based on naming)
-    print("\n   📍 Approximate by region:")
-    cursor.execute("SELECT COUNT(*) FROM pet_stores WHERE address LIKE '%City%'")
-    print(f"   • Metro Manila: ~30 stores")
-    print(f"   • Luzon: ~20 stores")
-    print(f"   • Visayas: ~15 stores")
-    print(f"   • Mindanao: ~15 stores")
-    print("="*60)
-    
-    conn.close()
+        # Count by region (approximate based on naming)
+        print("\n   📍 Approximate by region:")
+        print(f"   • Metro Manila: ~30 stores")
+        print(f"   • Luzon: ~20 stores")
+        print(f"   • Visayas: ~15 stores")
+        print(f"   • Mindanao: ~15 stores")
+        print("="*60)
 
 if __name__ == '__main__':
     print("🚀 Initializing PH PetCare Database with Comprehensive Pet Stores...")
-    init_database()
\ No newline at end of file
+    init_database(reset='--reset' in sys.argv[1:])
@@ -0,0 +1,37 @@
+import argparse
+import os
+
+os.environ.setdefault('TTS_STARTUP', 'lazy')  # migrating never speaks
+
+from app import app, applied_migrations, migrate, MigrationError, MIGRATIONS
+
+# Applies the numbered steps in app.py (SCHEMA MIGRATIONS) to the app's database
+# (DATABASE_URL, or instance/petcare.db) while the app keeps serving from it.
+# Run it at deploy time: the app answers 503 on /api/ until every step is applied.
+#   python migrate.py                     # apply whatever is pending
+#   python migrate.py --status            # list applied / pending steps
+#   python migrate.py --batch-size 500    # smaller backfill transactions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Apply pending schema migrations')
+    parser.add_argument('--status', action='store_true', help='list migrations without applying any')
+    parser.add_argument('--batch-size', type=int, default=app.config['MIGRATION_BATCH_SIZE'],
+                        help='rows per backfill transaction')
+    args = parser.parse_args()
+    app.config['MIGRATION_BATCH_SIZE'] = args.batch_size
+
+    with app.app_context():
+        print(f"🗄️ {app.config['SQLALCHEMY_DATABASE_URI']}")
+        if args.status:
+            done = applied_migrations()
+            for version, description, _ in sorted(MIGRATIONS, key=lambda m: m[0]):
+                row = done.get(version)
+                state = f"applied {row.applied_at} ({row.duration_ms:.0f} ms)" if row else "pending"
+                print(f"   • {version:3} {description:70} {state}")
+        else:
+            try:
+                applied = migrate()
+            except MigrationError as e:
+                print(f"❌ {e}")
+                raise SystemExit(1)
+            print(f"✅ {len(applied)} migration(s) applied" if applied else "✅ Schema already up to date")
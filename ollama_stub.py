@@ -0,0 +1,88 @@
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Stand-in for a local Ollama server: speaks the /api/chat streaming protocol
+# (one JSON object per line, "done": true on the last one) without a model
+REPLY = "Here are clinics I found for you: {first}. Call ahead to check their hours."
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive + chunked streaming, like Ollama
+    first_token_delay = 0.0
+    token_delay = 0.02
+    model = 'stub'
+
+    def do_POST(self):
+        if self.path != '/api/chat':
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        with self.server.lock:
+            self.server.requests.append(body)
+            self.server.connections.add(self.client_address)
+
+        system = next((m['content'] for m in body.get('messages', []) if m['role'] == 'system'), '')
+        clinic_lines = [line[2:].split(',')[0] for line in system.splitlines() if line.startswith('- ')]
+        words = REPLY.format(first=clinic_lines[0] if clinic_lines else 'none nearby').split(' ')
+
+        if not body.get('stream', True):
+            self.send_json({'model': self.model, 'message': {'role': 'assistant', 'content': ' '.join(words)}, 'done': True})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        time.sleep(self.first_token_delay)
+        for i, word in enumerate(words):
+            self.send_chunk({'message': {'role': 'assistant', 'content': word if i == 0 else ' ' + word}, 'done': False})
+            time.sleep(self.token_delay)
+        self.send_chunk({'message': {'role': 'assistant', 'content': ''}, 'done': True, 'done_reason': 'stop',
+                         'eval_count': len(words)})
+        self.wfile.write(b'0\r\n\r\n')
+
+    def send_chunk(self, chunk):
+        chunk = dict(model=self.model, created_at=datetime.now(timezone.utc).isoformat(), **chunk)
+        data = json.dumps(chunk).encode('utf-8') + b'\n'
+        self.wfile.write(f'{len(data):x}\r\n'.encode('ascii') + data + b'\r\n')
+        self.wfile.flush()
+
+    def send_json(self, data):
+        payload = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub(port=0, first_token_delay=0.0, token_delay=0.02):
+    """Serve the stub in a background thread; returns the server (server.requests logs bodies)"""
+    handler = type('Handler', (StubHandler,), {'first_token_delay': first_token_delay, 'token_delay': token_delay})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.requests = []
+    server.connections = set()  # client addresses seen, to tell keep-alive from reconnects
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stub Ollama /api/chat server')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--first-token-delay', type=float, default=0.0, help='seconds before the first token')
+    parser.add_argument('--token-delay', type=float, default=0.05, help='seconds between tokens')
+    args = parser.parse_args()
+
+    server = start_stub(args.port, args.first_token_delay, args.token_delay)
+    print(f"🤖 Stub Ollama listening on http://127.0.0.1:{server.server_address[1]}")
+    print("   Run the app with OLLAMA_ENABLED=1 to use it (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
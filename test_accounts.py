@@ -0,0 +1,108 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+# Checks accounts on a throwaway database: legacy password hashes are upgraded
+# at login and the upgraded hash is what gets stored, both server-side
+# session stores log in, rotate the id at login and forget it at logout, and
+# the database (where session rows live) is never served as a file
+WORKDIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORKDIR, 'petcare.db')}"
+os.environ.setdefault('TTS_STARTUP', 'lazy')
+
+from app import (app, db, get_session_store, kdf_params, MemorySessionStore, migrate,
+                 parse_password_hash, User, verify_password)
+
+def stored_hash(email):
+    with app.app_context():
+        return db.session.execute(db.text("SELECT password FROM users WHERE email = :e"), {'e': email}).scalar()
+
+def check_hash_upgrade(client):
+    email, password = 'legacy@example.com', 'old-password-1'
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    with app.app_context():
+        db.session.add(User(username='legacy', email=email, password=legacy, full_name='Legacy User'))
+        db.session.commit()
+
+    assert client.post('/api/login', json={'email': email, 'password': 'wrong-password'}).status_code == 401
+    assert stored_hash(email) == legacy, "a failed login must not touch the hash"
+
+    assert client.post('/api/login', json={'email': email, 'password': password}).status_code == 200
+    upgraded = stored_hash(email)
+    assert upgraded != legacy and parse_password_hash(upgraded)[0] == kdf_params(), upgraded
+    assert verify_password(password, upgraded) == (True, False)
+    print(f"✅ Legacy sha256 hash upgraded at login to {'$'.join(map(str, kdf_params()))}")
+
+    client.get('/api/logout')
+    assert client.post('/api/login', json={'email': email, 'password': password}).status_code == 200
+    assert stored_hash(email) == upgraded, "an up-to-date hash is not rewritten"
+    print("✅ The upgraded hash logs in and is left alone afterwards")
+
+def check_memory_store():
+    store = MemorySessionStore(max_sessions=2, idle_timeout=0.2)
+    store.set('a', {'n': 1})
+    store.set('b', {'n': 2})
+    assert store.get('a') == {'n': 1}
+    store.set('c', {'n': 3})  # 'b' is now the least recently used
+    assert store.get('b') is None and store.get('a') == {'n': 1} and store.get('c') == {'n': 3}
+    time.sleep(0.25)
+    assert store.get('a') is None and store.sweep() == 2 and not store.sessions
+    store.set('d', {'n': 4})
+    store.delete('d')
+    assert store.get('d') is None
+    print("✅ Memory session store evicts the least recently used session and expires idle ones")
+
+def check_sessions(backend):
+    app.config['SESSION_BACKEND'] = backend
+    client = app.test_client()
+    account = {'email': f'{backend}-session@example.com', 'password': 'pw-123456', 'full_name': 'Session Test'}
+    assert client.post('/api/register/user', json=account).get_json()['success']
+    assert client.get('/api/check-session').get_json() == {'logged_in': False}
+
+    # A session id planted before login (session fixation) must not survive it
+    planted = 'P' * 43
+    with app.app_context():
+        get_session_store().set(planted, {'planted': True})
+    client.set_cookie('session', planted)
+    assert client.post('/api/login', json=account).status_code == 200
+    sid = client.get_cookie('session').value
+    assert sid != planted
+    assert client.get('/api/check-session').get_json() == {'logged_in': True, 'username': 'Session Test'}
+    with app.app_context():
+        assert get_session_store().get(planted) is None and get_session_store().get(sid)['user_id']
+        if backend == 'database':
+            stored = db.session.execute(db.text("SELECT id FROM sessions")).scalars().all()
+            assert sid not in stored and hashlib.sha256(sid.encode()).hexdigest() in stored, "rows are keyed by hash"
+
+    client.get('/api/logout')
+    assert client.get('/api/check-session').get_json() == {'logged_in': False}
+    with app.app_context():
+        assert get_session_store().get(sid) is None
+    print(f"✅ {backend} sessions: login rotates the id, logout deletes the stored session")
+
+def check_private_files(client):
+    for path in ('/instance/petcare.db', '/instance/../instance/petcare.db', '/INSTANCE/petcare.db', '/petcare.db',
+                 '/database.db', '/instance/petcare.db-wal', '/instance/tts_cache/x.wav'):
+        assert client.get(path).status_code == 404, path
+    assert client.get('/index.html').status_code == 200
+    print("✅ The instance folder and database files are never served")
+
+if __name__ == '__main__':
+    print("👤 Testing accounts...")
+    client = app.test_client()
+    try:
+        with app.app_context():
+            migrate()
+        check_hash_upgrade(client)
+        check_memory_store()
+        for backend in ('memory', 'database'):
+            check_sessions(backend)
+        check_private_files(client)
+        print("✅ Account test complete!")
+    except AssertionError as e:
+        print(f"❌ Check failed: {e}")
+        raise SystemExit(1)
+    finally:
+        shutil.rmtree(WORKDIR, ignore_errors=True)
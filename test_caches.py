@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import time
+
+# Checks the response caches on a throwaway database: TTLCache expiry and LRU
+# eviction, /api/locations revalidation through its ETag, the rule-engine chat
+# answers cached per intent, city and location cell, and the two-tier audio cache
+WORKDIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORKDIR, 'petcare.db')}"
+os.environ.setdefault('TTS_STARTUP', 'lazy')
+
+from app import (app, AudioCache, CHAT_CACHE, db, get_catalogue, LOCATIONS_CACHE, migrate, refresh_catalogue,
+                 TTLCache, VetClinic)
+
+def check_ttl_cache():
+    cache = TTLCache(2, 0.2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)  # 'b' is now the least recently used
+    assert cache.get('b') is None and cache.get('a') == 1 and cache.get('c') == 3
+    time.sleep(0.25)
+    assert cache.get('a') is None and cache.get('c') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (3, 3, 0), stats
+    print("✅ TTLCache evicts the least recently used entry and expires entries after the TTL")
+
+def check_locations_etag(client):
+    url = '/api/locations?lat=14.5995&lng=120.9842'
+    first = client.get(url)
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and first.get_json() and first.headers['Cache-Control'] == 'no-cache'
+
+    hits = LOCATIONS_CACHE.stats()['hits']
+    neighbour = client.get('/api/locations?lat=14.59951&lng=120.98419')
+    assert neighbour.headers['ETag'] == etag and LOCATIONS_CACHE.stats()['hits'] == hits + 1
+    print("✅ Neighbouring coordinates share one cached /api/locations answer")
+
+    revalidated = client.get(url, headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304 and revalidated.get_data() == b'' and revalidated.headers['ETag'] == etag
+    print("✅ A matching If-None-Match gets 304 with no body")
+
+    with app.app_context():
+        clinic = VetClinic(clinic_name='ETag Clinic', address='Taft Avenue', latitude=14.5996, longitude=120.9843,
+                           city='Manila', region='Metro Manila', verified=True)
+        db.session.add(clinic)
+        db.session.commit()
+        refresh_catalogue()
+    changed = client.get(url, headers={'If-None-Match': etag})
+    assert changed.status_code == 200 and changed.headers['ETag'] != etag
+    assert any(place['name'] == 'ETag Clinic' for place in changed.get_json())
+    print("✅ A catalogue change gives a new ETag and a full answer")
+
+def chat(client, message, lat=14.5995, lng=120.9842):
+    return client.post('/api/ollama/chat', json={'message': message, 'latitude': lat, 'longitude': lng}).get_json()
+
+def group_stats(name):
+    return CHAT_CACHE.stats().get('groups', {}).get(name, {'hits': 0, 'misses': 0})
+
+def check_chat_cache(client):
+    app.config['OLLAMA_ENABLED'] = False
+    CHAT_CACHE.clear()
+    first = chat(client, 'any vet clinics in cebu?')
+    again = chat(client, 'Vet clinic in Cebu please', lat=7.07, lng=125.61)
+    assert first == again and 'Cebu' in first['response']
+    assert (group_stats('clinic')['misses'], group_stats('clinic')['hits']) == (1, 1), group_stats('clinic')
+    print("✅ Same intent and city share one cached chat answer, wherever the user is")
+
+    near = chat(client, 'pet shop near me', lat=14.5981, lng=120.9842)
+    same_cell = chat(client, 'pet shop near me', lat=14.5986, lng=120.9838)
+    elsewhere = chat(client, 'pet shop near me', lat=10.3157, lng=123.9054)
+    stats = group_stats('store')
+    assert near == same_cell and near != elsewhere and (stats['misses'], stats['hits']) == (2, 1), stats
+    print("✅ Nearby answers are shared within a location cell and not across cells")
+
+    with app.app_context():
+        db.session.add(VetClinic(clinic_name='Cache Clinic Cebu', address='Osmeña Boulevard', latitude=10.31,
+                                 longitude=123.89, city='Cebu City', region='Central Visayas', verified=True))
+        db.session.commit()
+        refresh_catalogue()
+    fresh = chat(client, 'any vet clinics in cebu?')
+    assert fresh != first and group_stats('clinic')['misses'] == 2
+    print("✅ A catalogue change invalidates cached chat answers")
+
+def check_audio_cache():
+    directory = os.path.join(WORKDIR, 'audio')
+    cache = AudioCache(directory, memory_bytes=100, disk_bytes=250)
+    first, second = b'1' * 60, b'2' * 60
+    cache.set('first', first)
+    assert cache.get('first') == first and cache.stats()['memory_hits'] == 1
+    cache.set('second', second)  # 120 bytes: 'first' leaves memory but stays on disk
+    assert list(cache.memory) == ['second'] and os.path.exists(cache.path('first'))
+    assert cache.get('first') == first and cache.stats()['disk_hits'] == 1
+    assert list(cache.memory) == ['first'], "a disk hit is promoted to memory"
+    print("✅ AudioCache serves from memory, falls back to disk and promotes disk hits")
+
+    restarted = AudioCache(directory, memory_bytes=100, disk_bytes=250)
+    assert restarted.get('second') == second and restarted.stats()['disk_hits'] == 1
+    assert restarted.get('missing') is None and restarted.stats()['misses'] == 1
+    print("✅ Files from an earlier run are served after a restart")
+
+    source = os.path.join(WORKDIR, 'synthesised.wav')
+    with open(source, 'wb') as f:
+        f.write(b'3' * 100)
+    restarted.adopt('third', source)
+    assert restarted.get('third') == b'3' * 100
+    assert os.stat(source).st_ino == os.stat(restarted.path('third')).st_ino, "adopted files are hard links"
+    restarted.set('fourth', b'4' * 60)  # 60 + 60 + 100 + 60 > 250: the oldest file goes
+    stats = restarted.stats()
+    assert stats['evictions'] == 1 and stats['disk_bytes'] <= 250 and not os.path.exists(restarted.path('first'))
+    restarted.set('huge', b'5' * 300)
+    assert not os.path.exists(restarted.path('huge')) and 'huge' not in restarted.memory
+    print("✅ Adopted files are hard-linked, the disk tier stays under its cap and oversized audio is skipped")
+
+if __name__ == '__main__':
+    print("🗃️ Testing the response caches...")
+    client = app.test_client()
+    try:
+        with app.app_context():
+            migrate()
+            get_catalogue()
+        check_ttl_cache()
+        check_locations_etag(client)
+        check_chat_cache(client)
+        check_audio_cache()
+        print("✅ Cache test complete!")
+    except AssertionError as e:
+        print(f"❌ Check failed: {e}")
+        raise SystemExit(1)
+    finally:
+        shutil.rmtree(WORKDIR, ignore_errors=True)
@@ -0,0 +1,130 @@
+import os
+import random
+
+os.environ.setdefault('TTS_STARTUP', 'lazy')  # the checks never speak
+
+from app import calculate_distance, CatalogueSnapshot, fold_text, tokenize
+
+# Checks the in-memory catalogue indexes against plain linear scans over a
+# synthetic catalogue: the lat/lng grid and the vectorized engine must return
+# exactly what checking every place with calculate_distance returns, and the
+# search index exactly what scoring every clinic one by one returns
+CITIES = ['Makati', 'Parañaque', 'Las Piñas', 'Cebu City', 'Davao City', 'Baguio', 'Los Baños', 'Quezon City']
+REGIONS = ['Metro Manila', 'Central Visayas', 'Davao Region', 'Cordillera', 'Calabarzon']
+WORDS = ['Animal', 'House', 'Veterinary', 'Vet', 'Clinic', 'Hospital', 'Pet', 'Care', 'Doña', 'Happy', 'Paws', 'Center']
+STREETS = ['Rizal Street', 'Mabini Avenue', 'Señor Santo Niño', 'Gen. Luna', 'Taft Avenue']
+
+def synthetic_catalogue(rng, clinics=3000, stores=1000):
+    def point():
+        # Mostly the Philippines, plus places near the antimeridian and the poles
+        area = rng.random()
+        if area < 0.8:
+            return round(rng.uniform(5.5, 18.5), 6), round(rng.uniform(117.0, 126.5), 6)
+        if area < 0.9:
+            return round(rng.uniform(-60, 60), 6), round(rng.choice([-1, 1]) * rng.uniform(178.5, 180), 6)
+        return round(rng.uniform(-89.9, 89.9), 6), round(rng.uniform(-180, 180), 6)
+
+    clinic_list = []
+    for i in range(clinics):
+        lat, lng = point()
+        clinic_list.append({
+            'name': ' '.join(rng.sample(WORDS, 3)), 'address': f"{i} {rng.choice(STREETS)}", 'lat': lat, 'lng': lng,
+            'contact': '', 'email': None, 'services': 'Vaccination', 'hours': '',
+            'region': rng.choice(REGIONS), 'city': rng.choice(CITIES),
+            'emergency': rng.random() < 0.1, '24hours': rng.random() < 0.05
+        })
+    store_list = []
+    for i in range(stores):
+        lat, lng = point()
+        store_list.append({'name': f"Store {i}", 'address': f"{i} Mabini Street", 'lat': lat, 'lng': lng,
+                           'contact': '', 'type': 'Pet Store'})
+    return clinic_list, store_list
+
+def random_queries(rng, count=300):
+    queries = []
+    for _ in range(count):
+        lat, lng = rng.uniform(5.5, 18.5), rng.uniform(117.0, 126.5)
+        if rng.random() < 0.2:
+            lat, lng = rng.uniform(-89.5, 89.5), rng.choice([rng.uniform(-180, 180), 179.9, -179.9])
+        radius = rng.choice([1, 5, 20, 50, 200, 2000, 20000])
+        queries.append((lat, lng, radius, rng.choice([1, 5, 10, 50])))
+    return queries
+
+def linear_scan(places, lat, lng, radius_km, limit):
+    hits = []
+    for i, place in enumerate(places):
+        distance = calculate_distance(lat, lng, place['lat'], place['lng'])
+        if distance <= radius_km:
+            hits.append((distance, i))
+    return sorted(hits)[:limit]
+
+def check_grid(snapshot, queries):
+    for lat, lng, radius, limit in queries:
+        for places, index in ((snapshot.clinics, snapshot.clinic_index), (snapshot.stores, snapshot.store_index)):
+            expected = linear_scan(places, lat, lng, radius, limit)
+            got = index.nearby(lat, lng, radius, limit)
+            assert got == expected, (lat, lng, radius, limit, got[:3], expected[:3])
+    print(f"✅ Grid index matches a linear scan on {len(queries)} random radius searches")
+
+def check_vectorized(snapshot, queries):
+    if snapshot.columns is None:
+        print("⚠️ numpy not installed, skipping the vectorized engine")
+        return
+    for lat, lng, radius, limit in queries:
+        clinics = [(d, 0, i) for d, i in linear_scan(snapshot.clinics, lat, lng, radius, limit)]
+        stores = [(d, 1, i) for d, i in linear_scan(snapshot.stores, lat, lng, radius, limit)]
+        assert snapshot.columns.nearest(lat, lng, radius, limit, 'clinics') == clinics, (lat, lng, radius)
+        assert snapshot.columns.nearest(lat, lng, radius, limit, 'stores') == stores, (lat, lng, radius)
+        assert snapshot.columns.nearest(lat, lng, radius, limit, 'all') == sorted(clinics + stores)[:limit], (lat, lng, radius)
+    print(f"✅ Vectorized engine matches a linear scan on {len(queries)} random radius searches")
+
+def scan_search(clinics, query, city, region, limit=50):
+    """ClinicSearchIndex.search's documented ranking, computed clinic by clinic"""
+    terms = tokenize(query)
+    scores = {}
+    for i, clinic in enumerate(clinics):
+        score = 0
+        if terms:
+            fields = [(token, weight) for field, weight in (('name', 3), ('city', 2), ('address', 1))
+                      for token in tokenize(clinic[field])]
+            term_scores = [max((weight + (token == term) for token, weight in fields if token.startswith(term)), default=0)
+                           for term in terms]
+            if all(term_scores):
+                score = sum(term_scores)
+        if city and fold_text(city) in fold_text(clinic['city']):
+            score += 2
+        if region and fold_text(region) in fold_text(clinic['region']):
+            score += 1
+        if score:
+            scores[i] = score
+    return sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+
+def check_search(snapshot, rng):
+    queries = [('vet', '', ''), ('veterinary clinic', '', ''), ('ani hou', '', ''), ('dona', '', ''), ('doña', '', ''),
+               ('', 'paranaque', ''), ('', 'Parañaque', ''), ('', 'las pi', ''), ('happy', 'cebu', 'visayas'),
+               ('nino', '', ''), ('zzz', '', ''), ('', '', 'metro')]
+    for _ in range(200):
+        words = [rng.choice(WORDS + CITIES + STREETS) for _ in range(rng.randint(1, 2))]
+        query = ' '.join(word[:rng.randint(1, len(word))] for word in words)
+        queries.append((query, rng.choice(['', '', rng.choice(CITIES)[:4]]), rng.choice(['', '', rng.choice(REGIONS)])))
+    for query, city, region in queries:
+        got = snapshot.search_index.search(query, city, region, limit=50)
+        assert got == scan_search(snapshot.clinics, query, city, region), (query, city, region)
+    assert snapshot.search_index.search(city='Paranaque') == snapshot.search_index.search(city='Parañaque')
+    assert snapshot.lookup.in_city('paranaque') == snapshot.lookup.in_city('Parañaque') != []
+    print(f"✅ Search index matches a scoring scan on {len(queries)} queries, with or without diacritics")
+
+if __name__ == '__main__':
+    print("🗺️ Testing the catalogue indexes...")
+    rng = random.Random(2024)
+    clinics, stores = synthetic_catalogue(rng)
+    snapshot = CatalogueSnapshot(clinics, stores, 0)
+    queries = random_queries(rng)
+    try:
+        check_grid(snapshot, queries)
+        check_vectorized(snapshot, queries)
+        check_search(snapshot, rng)
+        print("✅ Catalogue test complete!")
+    except AssertionError as e:
+        print(f"❌ Check failed: {e}")
+        raise SystemExit(1)
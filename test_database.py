@@ -0,0 +1,191 @@
+import glob
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+
+# Checks the data layer (catalogue, spatial queries, users, sessions) against a
+# throwaway SQLite file and, when one can be started here, a throwaway
+# PostgreSQL cluster. Each database runs in its own process because the
+# engine is bound when app is imported.
+def run_checks():
+    os.environ.setdefault('TTS_STARTUP', 'lazy')
+    from app import (app, applied_migrations, db, find_nearby_clinics, find_nearby_stores, get_catalogue, migrate,
+                     hold_catalogue_version, MigrationError, MIGRATIONS, nearby_backend, refresh_catalogue,
+                     release_catalogue_version, User, VetClinic)
+    from init_db import PH_PET_STORES, PH_VET_CLINICS
+    import app as petcare
+
+    client = app.test_client()
+    with app.app_context():
+        dialect = db.engine.dialect.name
+        migrate()
+        snapshot = get_catalogue()
+        assert len(snapshot.clinics) >= len(PH_VET_CLINICS) and len(snapshot.stores) >= len(PH_PET_STORES)
+        print(f"✅ [{dialect}] Catalogue seeded: {len(snapshot.clinics)} clinics, {len(snapshot.stores)} stores")
+
+        assert sorted(applied_migrations()) == sorted(m[0] for m in MIGRATIONS) and migrate() == []
+        print(f"✅ [{dialect}] All {len(MIGRATIONS)} schema migrations recorded, a second run is a no-op")
+
+        spatial = petcare.catalogue_spatial
+        assert spatial == ('rtree' if dialect == 'sqlite' else spatial)
+        queries = [(14.5995, 120.9842, 15), (10.3157, 123.9054, 20), (7.0645, 125.6078, 50)]
+        app.config['NEARBY_BACKEND'] = 'memory'
+        expected = [(find_nearby_clinics(*q, limit=10), find_nearby_stores(*q, limit=5)) for q in queries]
+        locations = client.get('/api/locations?lat=14.5995&lng=120.9842').get_json()
+        if spatial:
+            app.config['NEARBY_BACKEND'] = spatial
+            assert nearby_backend() == spatial
+            got = [(find_nearby_clinics(*q, limit=10), find_nearby_stores(*q, limit=5)) for q in queries]
+            assert [[c['name'] for c in clinics] for clinics, _ in got] == [[c['name'] for c in clinics] for clinics, _ in expected]
+            assert [[s['name'] for s in stores] for _, stores in got] == [[s['name'] for s in stores] for _, stores in expected]
+            petcare.LOCATIONS_CACHE.clear()
+            assert client.get('/api/locations?lat=14.5995&lng=120.9842').get_json() == locations
+            print(f"✅ [{dialect}] {spatial} index answers radius searches like the in-process engine")
+        else:
+            print(f"⚠️ [{dialect}] No spatial index here; radius searches use the in-process engine")
+
+        version = snapshot.version
+        clinic = VetClinic(clinic_name='Test Clinic', address='Test', latitude=14.6, longitude=120.98,
+                           city='Manila', region='Metro Manila', verified=True)
+        db.session.add(clinic)
+        db.session.commit()
+        try:
+            fresh = refresh_catalogue()
+            assert fresh.version != version and len(fresh.clinics) == len(snapshot.clinics) + 1
+            print(f"✅ [{dialect}] Catalogue version trigger fired on insert")
+        finally:
+            db.session.delete(clinic)
+            db.session.commit()
+
+        # What import_catalogue.py does around its batches, then an import that died holding the version
+        before = refresh_catalogue()
+        clinics = [VetClinic(clinic_name=f'Held Clinic {i}', address='Test', latitude=14.6, longitude=120.98,
+                             city='Manila', region='Metro Manila', verified=True) for i in range(2)]
+        try:
+            for clinic in clinics:
+                with db.engine.begin() as conn:
+                    hold_catalogue_version(conn)
+                db.session.add(clinic)
+                db.session.commit()
+                assert refresh_catalogue().version == before.version
+            with db.engine.begin() as conn:
+                release_catalogue_version(conn)
+            released = refresh_catalogue()
+            assert released.version == before.version + 1 and len(released.clinics) == len(before.clinics) + 2
+
+            with db.engine.begin() as conn:
+                hold_catalogue_version(conn)
+            db.session.delete(clinics.pop())
+            db.session.commit()
+            assert refresh_catalogue().version == released.version
+            with db.engine.begin() as conn:
+                conn.execute(db.text("UPDATE catalogue_version SET held_until = held_until - 3600"))
+            lapsed = refresh_catalogue()
+            assert lapsed.version == released.version + 1 and len(lapsed.clinics) == len(before.clinics) + 1
+            print(f"✅ [{dialect}] A held catalogue version moves once on release, or once its hold lapses")
+        finally:
+            for clinic in clinics:
+                db.session.delete(clinic)
+            db.session.commit()
+
+    app.config['SESSION_BACKEND'] = 'database'
+    account = {'email': 'db-test@example.com', 'password': 'pw-123456', 'full_name': 'DB Test'}
+    try:
+        assert client.post('/api/register/user', json=account).get_json()['success']
+        duplicate = client.post('/api/register/user', json=account)
+        assert duplicate.status_code == 400 and 'already' in duplicate.get_json()['error']
+        assert client.post('/api/login', json=account).status_code == 200
+        assert client.get('/api/check-session').get_json() == {'logged_in': True, 'username': 'DB Test'}
+        client.get('/api/logout')
+        assert client.get('/api/check-session').get_json() == {'logged_in': False}
+        print(f"✅ [{dialect}] Register (ON CONFLICT), login and database sessions work")
+    finally:
+        with app.app_context():
+            User.query.filter_by(email=account['email']).delete()
+            db.session.commit()
+
+    # Back to before migration 6, with a clinic listed twice
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(db.text("DROP INDEX ux_vet_clinics_name_address"))
+            conn.execute(db.text("DELETE FROM schema_migrations WHERE version = 6"))
+        petcare.schema_ready = False
+        assert client.get('/api/clinics/emergency').status_code == 503
+        twins = [VetClinic(clinic_name='Twin Clinic', address='Same Street', latitude=14.6, longitude=120.98,
+                           city='Manila', region='Metro Manila', verified=True) for _ in range(2)]
+        db.session.add_all(twins)
+        db.session.commit()
+        try:
+            migrate()
+            raise AssertionError('migration 6 ran over duplicated keys')
+        except MigrationError as e:
+            assert "'Twin Clinic' at 'Same Street' (2 rows)" in str(e), e
+        db.session.delete(twins[1])
+        db.session.commit()
+        assert migrate() == [6] and client.get('/api/clinics/emergency').status_code == 200
+        db.session.delete(twins[0])
+        db.session.commit()
+    print(f"✅ [{dialect}] /api/ answers 503 until migrations are applied; migration 6 names duplicated keys")
+
+def find_postgres_tools():
+    for directory in [''] + sorted(glob.glob('/usr/lib/postgresql/*/bin'), reverse=True):
+        initdb = shutil.which('initdb', path=directory or None)
+        pg_ctl = shutil.which('pg_ctl', path=directory or None)
+        if initdb and pg_ctl:
+            return initdb, pg_ctl
+    return None
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def run_against(url):
+    env = dict(os.environ, DATABASE_URL=url)
+    return subprocess.run([sys.executable, __file__, '--checks'], env=env).returncode == 0
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--checks']:
+        try:
+            run_checks()
+        except AssertionError as e:
+            print(f"❌ Check failed: {e}")
+            raise SystemExit(1)
+        raise SystemExit(0)
+
+    print("🗄️ Testing the data layer...")
+    workdir = tempfile.mkdtemp()
+    failed = False
+    try:
+        failed |= not run_against(f"sqlite:///{os.path.join(workdir, 'petcare.db')}")
+
+        url = os.environ.get('TEST_DATABASE_URL')
+        tools = find_postgres_tools()
+        try:
+            import psycopg2  # noqa: F401 (SQLAlchemy's default PostgreSQL driver)
+        except ImportError:
+            print("⚠️ psycopg2 not installed, skipping PostgreSQL")
+        else:
+            if url:
+                failed |= not run_against(url)
+            elif tools:
+                initdb, pg_ctl = tools
+                cluster, port = os.path.join(workdir, 'pg'), free_port()
+                subprocess.run([initdb, '-D', cluster, '-A', 'trust', '-U', 'postgres'], check=True, capture_output=True)
+                subprocess.run([pg_ctl, '-D', cluster, '-w', '-l', os.path.join(workdir, 'pg.log'),
+                                '-o', f"-p {port} -k {workdir} -c listen_addresses=''", 'start'], check=True, capture_output=True)
+                try:
+                    failed |= not run_against(f"postgresql://postgres@/postgres?host={workdir}&port={port}")
+                finally:
+                    subprocess.run([pg_ctl, '-D', cluster, '-m', 'fast', 'stop'], capture_output=True)
+            else:
+                print("⚠️ No PostgreSQL here (set TEST_DATABASE_URL or put initdb/pg_ctl on PATH), skipping it")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if failed:
+        raise SystemExit(1)
+    print("✅ Data layer test complete!")
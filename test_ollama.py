@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+# Checks /api/ollama/chat LLM mode against the stub Ollama server, on a
+# throwaway database
+WORKDIR = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORKDIR, 'petcare.db')}"
+os.environ.setdefault('TTS_STARTUP', 'lazy')
+
+from app import app, migrate
+from ollama_stub import start_stub
+
+def post_chat(client, message, **extra):
+    return client.post('/api/ollama/chat', json=dict(message=message, latitude=14.5995, longitude=120.9842, **extra))
+
+def read_events(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines() if line]
+
+if __name__ == '__main__':
+    print("🤖 Testing Ollama chat mode...")
+    client = app.test_client()
+    app.config['OLLAMA_ENABLED'] = True
+    app.config['OLLAMA_TIMEOUT'] = 0.5
+
+    try:
+        with app.app_context():
+            migrate()
+        stub = start_stub(token_delay=0.01)
+        app.config['OLLAMA_URL'] = f"http://127.0.0.1:{stub.server_address[1]}"
+
+        start = time.perf_counter()
+        response = post_chat(client, 'Is there a vet in Cebu?', stream=True)
+        assert response.mimetype == 'application/x-ndjson'
+        stream = response.response
+        first = json.loads(next(iter(stream)))
+        first_token_ms = (time.perf_counter() - start) * 1000
+        events = [first] + [json.loads(line) for line in stream if line.strip()]
+        assert 'token' in first and events[-1]['done'] and events[-1]['source'] == 'ollama'
+        assert events[-1]['response'] == ''.join(e['token'] for e in events if 'token' in e)
+        context = stub.requests[-1]['messages'][0]['content']
+        assert 'Cebu' in context, context
+        print(f"✅ Streamed {len(events) - 1} tokens, first after {first_token_ms:.0f} ms")
+        print(f"   {events[-1]['response']}")
+
+        result = post_chat(client, 'emergency vet please').get_json()
+        assert result['source'] == 'ollama' and result['response']
+        print("✅ Non-streaming reply collected from the stream")
+
+        for message in ('find vets near me', 'pet shop in cebu', 'clinics in davao'):
+            post_chat(client, message)
+        stats = client.get('/api/ollama/stats').get_json()
+        assert len(stub.connections) == 1 and stats['connections_reused'] == stats['model_calls'] - 1, stats
+        print(f"✅ {stats['model_calls']} model calls over {len(stub.connections)} keep-alive connection")
+
+        calls_before = len(stub.requests)
+        replies = []
+        threads = [threading.Thread(target=lambda: replies.append(post_chat(client, 'vet in makati').get_json()))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = client.get('/api/ollama/stats').get_json()
+        assert len(stub.requests) == calls_before + 1 and stats['coalesced'] == 4, stats
+        assert len({reply['response'] for reply in replies}) == 1
+        print("✅ 5 identical in-flight prompts shared 1 model call")
+
+        slow = start_stub(first_token_delay=2.0)
+        app.config['OLLAMA_URL'] = f"http://127.0.0.1:{slow.server_address[1]}"
+        final = read_events(post_chat(client, 'clinics in manila', stream=True))[-1]
+        assert final['fallback'] and final['source'] == 'rules' and 'Manila' in final['response']
+        print("✅ Slow model fell back to the rule engine")
+
+        app.config['OLLAMA_URL'] = 'http://127.0.0.1:9'
+        result = post_chat(client, 'statistics please').get_json()
+        assert result['source'] == 'rules' and 'Statistics' in result['response']
+        print("✅ Unreachable server fell back to the rule engine")
+
+        result = post_chat(client, 'hello', llm=False).get_json()
+        assert 'source' not in result and 'Hello' in result['response']
+        print("✅ llm=false skips the model")
+
+        print("✅ Ollama test complete!")
+
+    except AssertionError as e:
+        print(f"❌ Check failed: {e}")
+        raise SystemExit(1)
+    finally:
+        shutil.rmtree(WORKDIR, ignore_errors=True)
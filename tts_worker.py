@@ -0,0 +1,50 @@
+import json
+import sys
+import time
+
+import pyttsx3
+
+# One pyttsx3 engine per process, driven by app.py's TTSWorkerPool over
+# stdin/stdout, one JSON object per line:
+#   startup  -> {"ready": true, "voice": id} or {"ready": false, "error": ...}
+#   {"text", "path"} -> {"ok": true, "synth_ms": ...} or {"ok": false, "error": ...}
+def configure_engine(engine, rate, volume):
+    """Rate, volume and a Filipino/English voice; returns the voice id (or None)"""
+    engine.setProperty('rate', rate)
+    engine.setProperty('volume', volume)
+    for voice in engine.getProperty('voices'):
+        if 'filipino' in voice.name.lower() or 'english' in voice.name.lower():
+            engine.setProperty('voice', voice.id)
+            return voice.id
+    return None
+
+def main():
+    rate, volume = int(sys.argv[1]), float(sys.argv[2])
+    replies = sys.stdout
+    sys.stdout = sys.stderr  # engine chatter must not end up in the reply stream
+
+    def reply(message):
+        replies.write(json.dumps(message) + '\n')
+        replies.flush()
+
+    try:
+        engine = pyttsx3.init()
+        voice = configure_engine(engine, rate, volume)
+    except Exception as e:
+        reply({'ready': False, 'error': str(e)})
+        return
+    reply({'ready': True, 'voice': voice})
+
+    # Runs until the pool closes stdin (recycling, shutdown, or the web process dying)
+    for line in sys.stdin:
+        job = json.loads(line)
+        start = time.perf_counter()
+        try:
+            engine.save_to_file(job['text'], job['path'])
+            engine.runAndWait()
+            reply({'ok': True, 'synth_ms': round((time.perf_counter() - start) * 1000, 1)})
+        except Exception as e:
+            reply({'ok': False, 'error': str(e)})
+
+if __name__ == '__main__':
+    main()